@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: 2025 BD3D DIGITAL DESIGN (Dorian B.)
+#
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# NOTE Headless benchmarks of the customtab module.
+# Runs on plain python, without blender, thanks to the bpy stand-in of this folder.
+# Simulates N windows x M properties editors, K registered tabs of P panels each, 
+# and reports how the customtab hot paths scale when the amount of tabs and editors grows.
+#
+# Usage:
+#     python benchmarks/bench_customtab.py [--quick] [--json results.json]
+
+import os
+import sys
+import json
+import time
+import argparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+GROUPS = ('PLUGINS','OBJECT','SCENE','TOOLS','MYSTUDIO',)
+
+def _fresh_modules():
+    """import a fresh bpy stand-in and customtab module, so no state leaks between scenarios"""
+
+    for p in (ROOT, HERE):
+        if (p not in sys.path):
+            sys.path.insert(0, p)
+    for name in ('customtab','bpy'):
+        sys.modules.pop(name, None)
+
+    import bpy
+    import customtab
+
+    return bpy, customtab
+
+def _make_panels(bpy, tabidx:int, count:int) -> list:
+    """create the user panels of a tab"""
+
+    def draw(self, context):
+        self.layout.label(text="Hello")
+
+    return [type(f'BENCH{tabidx}_PT_{j}', (bpy.types.Panel,), {'bl_label':f"Panel {j}", 'draw':draw,}) for j in range(count)]
+
+def _setup(windows:int, editors:int, tabs:int, panels:int, tool_panels:int=10, register:bool=True):
+    """build a fake session, register the module and its tabs, and discover the editors"""
+
+    bpy, ct = _fresh_modules()
+    bpy.build_session(windows=windows, properties_areas=editors, tool_panels=tool_panels)
+
+    if (register):
+        ct.register()
+        for i in range(tabs):
+            ct.append_tab(
+                uniqueid=f'BENCH{i}',
+                icon='MONKEY',
+                group=GROUPS[i%len(GROUPS)],
+                poll=lambda context: context.active_object is not None,
+                panels=_make_panels(bpy, i, panels),
+                )
+        ct._timerfunc()
+
+    return bpy, ct
+
+def _spaces(bpy):
+    return [s for w in bpy.context.window_manager.windows for a in w.screen.areas for s in a.spaces if (s.type=='PROPERTIES')]
+
+def _timeit(fct, number:int) -> float:
+    """average microseconds per call"""
+
+    t = time.perf_counter()
+    for _ in range(number):
+        fct()
+
+    return (time.perf_counter()-t) / number * 1_000_000
+
+def bench_scenario(windows:int, editors:int, tabs:int, panels:int, number:int) -> dict:
+    """measure all hot paths for a given scenario, in microseconds"""
+
+    r = {}
+
+    #registration costs, on fresh modules
+    bpy, ct = _setup(windows, editors, tabs, panels, register=False)
+    t = time.perf_counter()
+    ct._reg_tool_impostors(True)
+    r['reg_tool_impostors'] = (time.perf_counter()-t) * 1_000_000
+
+    bpy, ct = _setup(windows, editors, tabs, panels, register=False)
+    ct.register()
+    panelsets = [_make_panels(bpy, i, panels) for i in range(tabs)]
+    t = time.perf_counter()
+    for i, ps in enumerate(panelsets):
+        ct.append_tab(uniqueid=f'BENCH{i}', icon='MONKEY', group=GROUPS[i%len(GROUPS)], panels=ps)
+    r['append_tab_all'] = (time.perf_counter()-t) * 1_000_000
+
+    #runtime costs
+    bpy, ct = _setup(windows, editors, tabs, panels)
+    spaces = _spaces(bpy)
+    context = bpy.context
+
+    def redraw_all_navbars():
+        for s in spaces:
+            context.space_data = s
+            ct._generate_enumitems(context, s)
+
+    def redraw_all_navbars_cold():
+        ct._clear_caches()
+        redraw_all_navbars()
+
+    r['enumitems_redraw_warm'] = _timeit(redraw_all_navbars, number)
+    r['enumitems_redraw_cold'] = _timeit(redraw_all_navbars_cold, max(1, number//10))
+    ct._timerfunc()
+
+    r['timer_steady'] = _timeit(ct._timerfunc, number)
+    r['depsgraph_handler_steady'] = _timeit(lambda: ct._handlerfct_TabCustv1_post(None), number)
+
+    #select a custom tab in every editor, then poll and draw the tool panels like blender would
+    for s in spaces:
+        context.space_data = s
+        setattr(context.window_manager, ct.get_customtab_propname(s), 'BENCH0')
+
+    patched = [cls for cls in vars(bpy.types).values() if isinstance(cls, type) and hasattr(cls, 'CustTabIsPatched')]
+    header = getattr(bpy.types, 'VIEW3D_PT_active_tool_duplicate')
+
+    def poll_all_panels():
+        for s in spaces:
+            context.space_data = s
+            for cls in patched:
+                cls.poll(context)
+
+    def draw_all_headers():
+        for s in spaces:
+            context.space_data = s
+            header().draw(context)
+
+    r['patched_polls_redraw'] = _timeit(poll_all_panels, max(1, number//10))
+    r['header_draw_redraw'] = _timeit(draw_all_headers, number)
+
+    return r
+
+def _print_curve(title:str, variable:str, rows:list):
+    """print a scaling table"""
+
+    metrics = list(rows[0][1].keys())
+    print(f"\n{title} (microseconds)")
+    print(variable.rjust(10) + "".join(m.rjust(max(len(m), 12)+2) for m in metrics))
+    for value, res in rows:
+        print(str(value).rjust(10) + "".join(f"{res[m]:.1f}".rjust(max(len(m), 12)+2) for m in metrics))
+
+    return None
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Headless benchmarks of the customtab module")
+    parser.add_argument('--quick', action='store_true', help="fewer iterations and smaller curves")
+    parser.add_argument('--json', default=None, help="also write the results to this json file")
+    parser.add_argument('--panels', type=int, default=3, help="amount of panels per tab")
+    parser.add_argument('--windows', type=int, default=1, help="amount of windows, editors are spread in each window")
+    args = parser.parse_args()
+
+    number = 20 if args.quick else 200
+    tabs_curve = (5, 20) if args.quick else (5, 10, 20, 40, 80)
+    editors_curve = (1, 4) if args.quick else (1, 2, 4, 8, 16)
+
+    results = {'tabs':[], 'editors':[],}
+
+    for k in tabs_curve:
+        results['tabs'].append((k, bench_scenario(args.windows, 4, k, args.panels, number)))
+    _print_curve(f"Scaling with registered tabs ({args.windows} window(s) x 4 editors, {args.panels} panels per tab)", "tabs", results['tabs'])
+
+    for m in editors_curve:
+        results['editors'].append((m, bench_scenario(args.windows, m, 20, args.panels, number)))
+    _print_curve(f"Scaling with properties editors per window ({args.windows} window(s), 20 tabs, {args.panels} panels per tab)", "editors", results['editors'])
+
+    if (args.json):
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=4)
+
+    return None
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+# SPDX-FileCopyrightText: 2025 BD3D DIGITAL DESIGN (Dorian B.)
+#
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# NOTE this is NOT blender's bpy. 
+# A minimal stand-in, only implementing what the customtab module needs, so we can benchmark it headlessly.
+# Build a fake session with 'build_session()', see 'bench_customtab.py'.
+
+import contextlib
+from types import SimpleNamespace
+
+#the native tabs blender would list in the 'space.context' enum
+NATIVE_CONTEXTS = ('TOOL','RENDER','OUTPUT','VIEW_LAYER','SCENE','WORLD','COLLECTION','OBJECT','MODIFIER','SHADERFX',
+                   'PARTICLES','PHYSICS','CONSTRAINT','DATA','BONE','BONE_CONSTRAINT','MATERIAL','TEXTURE',)
+
+# ooooooooo.                                          
+# `888   `Y88.                                        
+#  888   .d88' oooo d8b  .ooooo.  oo.ooooo.   .oooo.o 
+#  888ooo88P'  `888""8P d88' `88b  888' `88b d88(  "8 
+#  888          888     888   888  888   888 `"Y88b.  
+#  888          888     888   888  888   888 o.  )88b 
+# o888o        d888b    `Y8bod8P'  888bod8P' 8""888P' 
+#                                  888                
+#                                 o888o               
+
+class _Property:
+    """a bpy.props property, acting as a descriptor once set on a type"""
+
+    def __init__(self, kind, **kwargs):
+        self.kind = kind
+        self.kwargs = kwargs
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def _items(self, inst):
+        items = self.kwargs.get('items', ())
+        if callable(items):
+            items = items(inst, context)
+        return items or ()
+
+    def __get__(self, inst, owner):
+        if (inst is None):
+            return self
+        stored = inst._idprops.get(self.name, self.kwargs.get('default', 0 if self.kind=='ENUM' else None))
+        if (self.kind != 'ENUM'):
+            return stored
+        #dynamic enums are stored as integers
+        for item in self._items(inst):
+            if item and (item[4] == stored):
+                return item[0]
+        return ''
+
+    def __set__(self, inst, value):
+        if (self.kind == 'ENUM'):
+            for item in self._items(inst):
+                if item and (item[0] == value):
+                    inst._idprops[self.name] = item[4]
+                    break
+            else:
+                raise TypeError(f'bpy_struct: item.attr = val: enum "{value}" not found')
+        else:
+            inst._idprops[self.name] = value
+        update = self.kwargs.get('update')
+        if (update):
+            update(inst, context)
+
+class _PropsModule:
+    EnumProperty = staticmethod(lambda **kw: _Property('ENUM', **kw))
+    BoolProperty = staticmethod(lambda **kw: _Property('BOOL', **kw))
+    IntProperty = staticmethod(lambda **kw: _Property('INT', **kw))
+
+props = _PropsModule()
+
+class _StructMeta(type):
+    """like blender, setting a property on a type registers it"""
+
+    def __setattr__(cls, name, value):
+        if isinstance(value, _Property):
+            value.name = name
+        return super().__setattr__(name, value)
+
+class _Struct(metaclass=_StructMeta):
+
+    def as_pointer(self):
+        return id(self)
+
+class _ID(_Struct):
+    """a struct supporting custom properties"""
+
+    def __init__(self):
+        self._idprops = {}
+
+    def __getitem__(self, key):
+        return self._idprops[key]
+
+    def __setitem__(self, key, value):
+        self._idprops[key] = value
+
+    def __delitem__(self, key):
+        del self._idprops[key]
+
+    def __contains__(self, key):
+        return key in self._idprops
+
+    def get(self, key, default=None):
+        return self._idprops.get(key, default)
+
+    def keys(self):
+        return self._idprops.keys()
+
+# ooooo     ooo ooooo 
+# `888'     `8' `888' 
+#  888       8   888  
+#  888       8   888  
+#  888       8   888  
+#  `88.    .8'   888  
+#    `YbodP'    o888o 
+
+class _Layout:
+    """a layout swallowing every drawing call"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self.calls += 1
+            if name in {'row','column','box','split'}:
+                return self
+            if (name == 'panel'):
+                return self, self
+            return None
+        return call
+
+class Panel:
+    """blender panels base class"""
+
+    def __init__(self, layout=None):
+        self.layout = layout or _Layout()
+
+class WindowManager(_ID):
+
+    def __init__(self):
+        super().__init__()
+        self.windows = []
+
+class SpaceProperties(_Struct):
+    type = 'PROPERTIES'
+
+    def __init__(self):
+        self._context = 'OBJECT'
+        self.pin_id = None
+        self.search_filter = ''
+
+    @property
+    def context(self):
+        return self._context
+
+    @context.setter
+    def context(self, value):
+        #mimic blender, the list of available items is only given in the error message
+        available = [c for c in NATIVE_CONTEXTS if _native_available(c)]
+        if (value not in available):
+            tup = ", ".join(f"'{c}'" for c in available)
+            raise TypeError(f'bpy_struct: item.attr = val: enum "{value}" not found in ({tup})')
+        self._context = value
+
+class SpaceView3D(_Struct):
+    type = 'VIEW_3D'
+
+class Region(_Struct):
+
+    def __init__(self, type):
+        self.type = type
+        self.redraws = 0
+
+    def tag_redraw(self):
+        self.redraws += 1
+
+class Area(_Struct):
+
+    def __init__(self, type):
+        self.type = type
+        self.spaces = [SpaceProperties() if (type=='PROPERTIES') else SpaceView3D()]
+        self.regions = [Region('NAVIGATION_BAR'), Region('WINDOW')]
+
+    def tag_redraw(self):
+        for r in self.regions:
+            r.tag_redraw()
+
+class Screen(_ID):
+
+    def __init__(self, name, areas):
+        super().__init__()
+        self.name = name
+        self.areas = areas
+        self.is_animation_playing = False
+
+class Window(_Struct):
+
+    def __init__(self, screen):
+        self.screen = screen
+
+class Collection(_Struct):
+
+    def __init__(self, name):
+        self.name = name
+
+class Scene(_ID):
+
+    def __init__(self):
+        super().__init__()
+        self.collection = Collection("Scene Collection")
+        self.world = object()
+        self.frame_current = 1
+
+class Object(_ID):
+
+    def __init__(self, name, type='MESH'):
+        super().__init__()
+        self.name = name
+        self.type = type
+        self.mode = 'OBJECT'
+        self.data = None
+
+class Image(_ID):
+    pass
+
+types = SimpleNamespace(
+    Panel=Panel, WindowManager=WindowManager, SpaceProperties=SpaceProperties, Image=Image, Object=Object,
+    )
+
+def _native_available(ctx):
+    obj = context.active_object
+    if ctx in {'OBJECT','PHYSICS','CONSTRAINT','DATA'}:
+        return obj is not None
+    if ctx in {'MODIFIER','MATERIAL'}:
+        return (obj is not None) and (obj.type in {'MESH','CURVE'})
+    if ctx == 'PARTICLES':
+        return (obj is not None) and (obj.type == 'MESH')
+    if ctx in {'SHADERFX','BONE','BONE_CONSTRAINT'}:
+        return False
+    if ctx == 'COLLECTION':
+        return context.collection is not context.scene.collection
+    return True
+
+#the panels we are monkey-patching
+
+class _ToolPanel:
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Tool"
+
+    def draw(self, context):
+        self.layout.label(text="Tool")
+
+class PROPERTIES_PT_navigation_bar(Panel):
+
+    def draw(self, context):
+        self.layout.prop_tabs_enum(context.space_data, 'context', icon_only=True)
+
+def make_tool_panels(count:int, children:int=0):
+    """create the native 'Tool' category panels of the 3D viewport sidebar"""
+
+    made = []
+    for i in range(count):
+        name = 'VIEW3D_PT_active_tool_duplicate' if (i==0) else f'VIEW3D_PT_tool_{i}'
+        parent = type(name, (Panel, _ToolPanel), {})
+        made.append(parent)
+        for j in range(children):
+            made.append(type(f'{name}_child{j}', (Panel, _ToolPanel), {'bl_parent_id':name}))
+
+    for cls in made:
+        utils.register_class(cls)
+
+    return made
+
+# ooooooooo.                                          .o8  
+# `888   `Y88.                                       "888  
+#  888   .d88'  .oooo.   oooo    ooo  .ooooo.   .oooo888  
+#  888ooo88P'  `P  )88b   `88.  .8'  d88' `88b d88' `888  
+#  888          .oP"888    `88..8'   888ooo888 888   888  
+#  888         d8(  888     `888'    888    .o 888   888  
+# o888o        `Y888""8o     .8'     `Y8bod8P' `Y8bod88P" 
+#                        .o..P'                           
+#                        `Y8P'                            
+
+class _Context(SimpleNamespace):
+
+    @contextlib.contextmanager
+    def temp_override(self, **kwargs):
+        old = {k:getattr(self, k, None) for k in list(kwargs)+['space_data']}
+        for k,v in kwargs.items():
+            setattr(self, k, v)
+        if kwargs.get('area') is not None:
+            self.space_data = kwargs['area'].spaces[0]
+        try:
+            yield self
+        finally:
+            for k,v in old.items():
+                setattr(self, k, v)
+
+context = _Context()
+data = SimpleNamespace(window_managers=[], screens=[], objects=[])
+
+class _Timers:
+
+    def __init__(self):
+        self.registered = {}
+
+    def register(self, fct, first_interval=0.0, persistent=False):
+        self.registered[fct] = first_interval
+
+    def unregister(self, fct):
+        if (fct not in self.registered):
+            raise ValueError("Error: function is not registered")
+        del self.registered[fct]
+
+    def is_registered(self, fct):
+        return fct in self.registered
+
+class _Handlers(SimpleNamespace):
+
+    def __iter__(self):
+        return iter([v for v in vars(self).values() if isinstance(v, list)])
+
+def _persistent(fct):
+    fct._bpy_persistent = True
+    return fct
+
+app = SimpleNamespace(
+    version=(4,2,0),
+    background=False,
+    timers=_Timers(),
+    is_job_running=lambda job_type: False,
+    handlers=_Handlers(
+        persistent=_persistent, 
+        depsgraph_update_post=[], load_pre=[], load_post=[],
+        render_init=[], render_complete=[], render_cancel=[],
+        object_bake_pre=[], object_bake_complete=[], object_bake_cancel=[],
+        animation_playback_pre=[], animation_playback_post=[],
+        ),
+    )
+
+def _register_class(cls):
+    setattr(types, getattr(cls, 'bl_idname', cls.__name__), cls)
+
+def _unregister_class(cls):
+    name = getattr(cls, 'bl_idname', cls.__name__)
+    if (getattr(types, name, None) is not cls):
+        raise RuntimeError(f"unregister_class(...): missing bl_rna attribute from '{cls.__name__}'")
+    delattr(types, name)
+
+utils = SimpleNamespace(register_class=_register_class, unregister_class=_unregister_class)
+msgbus = SimpleNamespace(subscribe_rna=lambda **kwargs: None, clear_by_owner=lambda owner: None)
+
+def build_session(windows:int=1, properties_areas:int=1, tool_panels:int=10, tool_children:int=2):
+    """(re)build a fake blender session with the given amount of windows, each containing the given amount of properties editors"""
+
+    wm = WindowManager()
+    screens = []
+    for w in range(windows):
+        areas = [Area('VIEW_3D')] + [Area('PROPERTIES') for _ in range(properties_areas)]
+        screen = Screen(f"Layout.{w:03}", areas)
+        screens.append(screen)
+        wm.windows.append(Window(screen))
+
+    scene = Scene()
+    obj = Object("Cube")
+    context.window_manager = wm
+    context.window = wm.windows[0] if wm.windows else None
+    context.screen = context.window.screen if context.window else None
+    context.area = None
+    context.region = None
+    context.space_data = None
+    context.scene = scene
+    context.view_layer = None
+    context.collection = scene.collection
+    context.active_object = obj
+    context.active_bone = None
+    context.selected_objects = [obj]
+    context.mode = 'OBJECT'
+
+    data.window_managers[:] = [wm]
+    data.screens[:] = screens
+    data.objects[:] = [obj]
+
+    types.PROPERTIES_PT_navigation_bar = PROPERTIES_PT_navigation_bar
+    make_tool_panels(tool_panels, tool_children)
+
+    return wm
@@ -25,6 +25,8 @@
 #     append_tab(uniqueid="MYUNIQUENAME", icon="GHOST_ENABLED", name="Ghost Tab", panels=panellistGhost,)
 #     ```
 #     - Important: Use a unique `uniqueid` to avoid conflicts with other tools.
+#     - If you have many tabs, pass them all at once to `append_tabs()`, a list of `append_tab()` arguments dictionaries.
+#       Use `remove_tabs()` to remove some of them again.
 #
 # Note:
 # - Do not access the internal functions of this module (functions starting with `_`) 
@@ -33,6 +35,10 @@
 #   avoid automatically registering classes created by this module.
 # - Please avoid loading too many custom tabs, and make sure your tool actually deserved to be placed in such editor.
 #   Keep in mind, we don't want this place to be overcrowded too quickly!
+# - If your tab `draw` or `header` callbacks need expensive data, compute it with `register_provider()`, 
+#   and read it from your callbacks with `get_provider_data()`, the editor won't freeze meanwhile.
+# - If the Properties editor feels slow, use `enable_customtab_stats()` then `get_customtab_stats()` or `dump_customtab_stats(filepath)`
+#   to measure the time spent in this module, and in each tab poll. `get_customtab_costs()` ranks the add-ons by the ui cost of their tabs.
 # 
 # Important:
 # - Please do not modify the code, or implement your own version of this trick.
@@ -43,7 +49,7 @@
 DEBUG_MODE = False
 
 module_info = {
-    'version':(0,9,1), #In beta. Need some work..
+    'version':(0,10,0), #In beta. Need some work..
     'blender_version_min':(4,2,0),
     'project_url':'https://github.com/DB3D/BlenderCustomPropTab/',
 }
@@ -62,7 +68,9 @@ module_info = {
 #   Solution: So what we'll do instead is impost the draw function of 'PROPERTIES_PT_navigation_bar' with our own Enum that mimics the original.
 #
 # - Constraint: There's no way to register a Python property per SpaceProperties for our new TabEnum, 
-#   Solution: we are automatically registering as many tab EnumProperties for every PropertiesEditor from their memory address.
+#   Solution: we keep a pool of tab EnumProperties, and assign a free one to every PropertiesEditor from a stable key 
+#   (screen name, area index, space index), surviving file reloads. Slots are released when their editor is closed, then reused by the next editor.
+#   The selected custom tab of each editor is stored in its screen, and selected again after a file reload.
 #
 # - Essentially, when you navigate on the properties editor, you'll not use 'space.context' anymore, 
 #   but a unique equivalent window_manager.EnumProperty per editor.
@@ -77,6 +85,7 @@ module_info = {
 #
 # - Because this code can be executed multiple times, as it can be hosted by multiple tools in the same Blender session, 
 #   we took extra care to register/unregister Properties, Classes, and panels only when needed.
+#   The registered module instances elect the newest one of them as engine, it serves all enum, poll, draw, handler and timer calls.
 
 # TODO: 
 # - Important: 
@@ -90,7 +99,14 @@ module_info = {
 #    - append after/before a specific tabid??
 
 import bpy
-from collections.abc import Iterable
+import sys
+import time
+import types
+import json
+import functools
+import tracemalloc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 # oooooooooo.                 .             
 # `888'   `Y8b              .o8             
@@ -102,27 +118,29 @@ from collections.abc import Iterable
 
 
 
-# do we imitate the poll behavior of the native tabs??
+# we imitate the poll behavior of the native tabs, so we don't have to ask blender which tabs are available.
 # https://github.com/blender/blender/blob/main/source/blender/editors/space_buttons/
 # see buttons_context & buttons_context_path functions
+# NOTE these rules are for unpinned editors only. Pinned editors are rooted on their pinned ID instead.
 
-# def _poll_tool(context):
-#     return True
+def _poll_tool(context):
+    return True
 
-# def _poll_render(context):
-#     return True
+def _poll_render(context):
+    return (context.scene is not None)
 
-# def _poll_output(context):
-#     return True
+def _poll_output(context):
+    return (context.scene is not None)
 
-# def _poll_viewlayer(context):
-#     return True
+def _poll_viewlayer(context):
+    return (context.scene is not None)
 
-# def _poll_scene(context):
-#     return True
+def _poll_scene(context):
+    return (context.scene is not None)
 
-# def _poll_world(context):
-#     return True
+def _poll_world(context):
+    # the tab is still there if the scene has no world, so we can create one
+    return (context.scene is not None)
 
 def _poll_collection(context):
     return (context.collection!=context.scene.collection)
@@ -130,68 +148,72 @@ def _poll_collection(context):
 def _poll_object(context):
     return (context.active_object is not None)
 
-# def _poll_modifier(context):
-#     obj = context.active_object
-#     return _poll_object(context) and (obj.type in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'LATTICE', 'GREASEPENCIL','VOLUME',})
+def _poll_modifier(context):
+    obj = context.active_object
+    return _poll_object(context) and (obj.type in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'LATTICE', 'GPENCIL', 'CURVES', 'POINTCLOUD', 'VOLUME', 'GREASEPENCIL',})
 
-# def _poll_shaderfx(context):
-#     obj = context.active_object
-#     return _poll_object(context) and (obj.type in {'GREASEPENCIL',})
+def _poll_shaderfx(context):
+    obj = context.active_object
+    return _poll_object(context) and (obj.type in {'GPENCIL', 'GREASEPENCIL',})
 
-# def _poll_particles(context):
-#     obj = context.active_object
-#     return _poll_object(context) and (obj.type in {'MESH',})
+def _poll_particles(context):
+    obj = context.active_object
+    return _poll_object(context) and (obj.type in {'MESH',})
 
-# def _poll_physics(context):
-#     return _poll_object(context)
+def _poll_physics(context):
+    return _poll_object(context)
 
-# def _poll_constraint(context):
-#     return _poll_object(context)
+def _poll_constraint(context):
+    return _poll_object(context)
 
-# def _poll_data(context):
-#     return _poll_object(context)
+def _poll_data(context):
+    #all objects have a data tab, even empties
+    return _poll_object(context)
 
-# def _poll_bone(context):
-#     return (context.active_bone is not None)
+def _poll_bone(context):
+    obj = context.active_object
+    return _poll_object(context) and (obj.type=='ARMATURE') and (context.active_bone is not None)
 
-# def _poll_bone_constraint(context):
-#     return _poll_bone(context)
+def _poll_bone_constraint(context):
+    #pose bones only, not available in armature edit mode
+    return _poll_bone(context) and (context.active_object.mode!='EDIT')
 
-# def _poll_material(context):
-#     obj = context.active_object
-#     return _poll_object(context) and (obj.type in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'GREASEPENCIL','META', 'VOLUME'})
+def _poll_material(context):
+    obj = context.active_object
+    return _poll_object(context) and (obj.type in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META', 'GPENCIL', 'CURVES', 'POINTCLOUD', 'VOLUME', 'GREASEPENCIL',})
 
-# def _poll_texture(context):
-#     return True
-#     return (context.material or 
-#             (context.world and context.world.use_nodes) or 
-#             (context.light and context.light.use_nodes) or
-#             context.texture)
+def _poll_texture(context):
+    # in practice there's always a texture user, (freestyle linestyle, brushes, modifiers..)
+    return True
+    # return (context.material or 
+    #         (context.world and context.world.use_nodes) or 
+    #         (context.light and context.light.use_nodes) or
+    #         context.texture)
 
 # the native possible items
 NATIVE_ITEMS = [
-    {'id':'TOOL',            'group':'TOOLS',      'icon':'TOOL_SETTINGS',   'poll':None, 'name':"Tool",             'description':"Active Tool and Workspace settings",},
+    {'id':'TOOL',            'group':'TOOLS',      'icon':'TOOL_SETTINGS',   'poll':_poll_tool,            'name':"Tool",             'description':"Active Tool and Workspace settings",},
     # None,
-    {'id':'RENDER',          'group':'SCENE',      'icon':'SCENE',           'poll':None, 'name':"Render",           'description':"Render Properties",},
-    {'id':'OUTPUT',          'group':'SCENE',      'icon':'OUTPUT',          'poll':None, 'name':"Output",           'description':"Output Properties",},
-    {'id':'VIEW_LAYER',      'group':'SCENE',      'icon':'RENDERLAYERS',    'poll':None, 'name':"View Layer",       'description':"View Layer Properties",},
-    {'id':'SCENE',           'group':'SCENE',      'icon':'SCENE_DATA',      'poll':None, 'name':"Scene",            'description':"Scene Properties",},
-    {'id':'WORLD',           'group':'SCENE',      'icon':'WORLD',           'poll':None, 'name':"World",            'description':"World Properties",},
+    {'id':'RENDER',          'group':'SCENE',      'icon':'SCENE',           'poll':_poll_render,          'name':"Render",           'description':"Render Properties",},
+    {'id':'OUTPUT',          'group':'SCENE',      'icon':'OUTPUT',          'poll':_poll_output,          'name':"Output",           'description':"Output Properties",},
+    {'id':'VIEW_LAYER',      'group':'SCENE',      'icon':'RENDERLAYERS',    'poll':_poll_viewlayer,       'name':"View Layer",       'description':"View Layer Properties",},
+    {'id':'SCENE',           'group':'SCENE',      'icon':'SCENE_DATA',      'poll':_poll_scene,           'name':"Scene",            'description':"Scene Properties",},
+    {'id':'WORLD',           'group':'SCENE',      'icon':'WORLD',           'poll':_poll_world,           'name':"World",            'description':"World Properties",},
     # None,
-    {'id':'COLLECTION',      'group':'COLLECTION', 'icon':'GROUP',           'poll':None, 'name':"Collection",       'description':"Collection Properties",},
+    {'id':'COLLECTION',      'group':'COLLECTION', 'icon':'GROUP',           'poll':_poll_collection,      'name':"Collection",       'description':"Collection Properties",},
     # None,
-    {'id':'OBJECT',          'group':'OBJECT',     'icon':'OBJECT_DATA',     'poll':None, 'name':"Object",           'description':"Object Properties",},
-    {'id':'MODIFIER',        'group':'OBJECT',     'icon':'MODIFIER',        'poll':None, 'name':"Modifiers",        'description':"Modifier Properties",},
-    {'id':'SHADERFX',        'group':'OBJECT',     'icon':'SHADERFX',        'poll':None, 'name':"Effects",          'description':"Visual Effects Properties",},
-    {'id':'PARTICLES',       'group':'OBJECT',     'icon':'PARTICLES',       'poll':None, 'name':"Particles",        'description':"Particle Properties",},
-    {'id':'PHYSICS',         'group':'OBJECT',     'icon':'PHYSICS',         'poll':None, 'name':"Physics",          'description':"Physics Properties",},
-    {'id':'CONSTRAINT',      'group':'OBJECT',     'icon':'CONSTRAINT',      'poll':None, 'name':"Constraints",      'description':"Object Constraint Properties",},
-    {'id':'DATA',            'group':'OBJECT',     'icon':'*DATAICON*',      'poll':None, 'name':"Data",             'description':"Object Data Properties",},
-    {'id':'BONE',            'group':'OBJECT',     'icon':'BONE_DATA',       'poll':None, 'name':"Bone",             'description':"Bone Properties",},
-    {'id':'BONE_CONSTRAINT', 'group':'OBJECT',     'icon':'CONSTRAINT_BONE', 'poll':None, 'name':"Bone Constraints", 'description':"Bone Constraint Properties",},
-    {'id':'MATERIAL',        'group':'OBJECT',     'icon':'MATERIAL',        'poll':None, 'name':"Material",         'description':"Material Properties",},
+    {'id':'OBJECT',          'group':'OBJECT',     'icon':'OBJECT_DATA',     'poll':_poll_object,          'name':"Object",           'description':"Object Properties",},
+    {'id':'MODIFIER',        'group':'OBJECT',     'icon':'MODIFIER',        'poll':_poll_modifier,        'name':"Modifiers",        'description':"Modifier Properties",},
+    {'id':'SHADERFX',        'group':'OBJECT',     'icon':'SHADERFX',        'poll':_poll_shaderfx,        'name':"Effects",          'description':"Visual Effects Properties",},
+    {'id':'PARTICLES',       'group':'OBJECT',     'icon':'PARTICLES',       'poll':_poll_particles,       'name':"Particles",        'description':"Particle Properties",},
+    {'id':'PHYSICS',         'group':'OBJECT',     'icon':'PHYSICS',         'poll':_poll_physics,         'name':"Physics",          'description':"Physics Properties",},
+    {'id':'CONSTRAINT',      'group':'OBJECT',     'icon':'CONSTRAINT',      'poll':_poll_constraint,      'name':"Constraints",      'description':"Object Constraint Properties",},
+    {'id':'DATA',            'group':'OBJECT',     'icon':'*DATAICON*',      'poll':_poll_data,            'name':"Data",             'description':"Object Data Properties",},
+    {'id':'BONE',            'group':'OBJECT',     'icon':'BONE_DATA',       'poll':_poll_bone,            'name':"Bone",             'description':"Bone Properties",},
+    {'id':'BONE_CONSTRAINT', 'group':'OBJECT',     'icon':'CONSTRAINT_BONE', 'poll':_poll_bone_constraint, 'name':"Bone Constraints", 'description':"Bone Constraint Properties",},
+    {'id':'MATERIAL',        'group':'OBJECT',     'icon':'MATERIAL',        'poll':_poll_material,        'name':"Material",         'description':"Material Properties",},
     # None,
-    {'id':'TEXTURE',         'group':'TEXTURE',     'icon':'TEXTURE',        'poll':None, 'name':"Texture",          'description':"Texture Properties",},
+    {'id':'TEXTURE',         'group':'TEXTURE',     'icon':'TEXTURE',        'poll':_poll_texture,         'name':"Texture",          'description':"Texture Properties",},
     ]
 
 NATIVE_IDS = [
@@ -200,6 +222,28 @@ NATIVE_IDS = [
     if type(e) is dict
     ]
 
+# users can hide native tabs from the navigation bar (blender 4.2+)
+NATIVE_SHOWFLAGS = {
+    'TOOL':'show_properties_tool',
+    'RENDER':'show_properties_render',
+    'OUTPUT':'show_properties_output',
+    'VIEW_LAYER':'show_properties_view_layer',
+    'SCENE':'show_properties_scene',
+    'WORLD':'show_properties_world',
+    'COLLECTION':'show_properties_collection',
+    'OBJECT':'show_properties_object',
+    'MODIFIER':'show_properties_modifiers',
+    'SHADERFX':'show_properties_effects',
+    'PARTICLES':'show_properties_particles',
+    'PHYSICS':'show_properties_physics',
+    'CONSTRAINT':'show_properties_constraints',
+    'DATA':'show_properties_data',
+    'BONE':'show_properties_bone',
+    'BONE_CONSTRAINT':'show_properties_bone_constraints',
+    'MATERIAL':'show_properties_material',
+    'TEXTURE':'show_properties_texture',
+    }
+
 # ooooo     ooo     .    o8o  oooo           
 # `888'     `8'   .o8    `"'  `888           
 #  888       8  .o888oo oooo   888   .oooo.o 
@@ -214,24 +258,161 @@ def _dprint(*args):
         return print(*args)
     return None
     
-def _all_properties_spaces(context=None):
-    """return a generator of all properties areas space"""
-    if (context is None):
-        context = bpy.context
-    wm = context.window_manager
-    for w in wm.windows:
-        for a in w.screen.areas:
-            if (a.type == 'PROPERTIES'):
-                for s in a.spaces:
-                    if (s.type == 'PROPERTIES'):
-                        yield s
+# Instrumentation of our hot paths. Disabled by default, see 'enable_customtab_stats'.
+# STATS stores, per measured name, [count, total seconds, max seconds, histogram]. 
+# The histogram counts durations in power of two microseconds buckets.
+STATS_ENABLED = False
+STATS = {}
+STATS_BUCKETS = 24
+STATS_SHOW_COSTS = False
+
+def _stats_record(name:str, duration:float):
+    """store a duration measurement"""
+
+    entry = STATS.get(name)
+    if (entry is None):
+        entry = STATS[name] = [0, 0.0, 0.0, [0]*STATS_BUCKETS]
+
+    entry[0] += 1
+    entry[1] += duration
+    if (duration > entry[2]):
+        entry[2] = duration
+    entry[3][min(int(duration*1_000_000).bit_length(), STATS_BUCKETS-1)] += 1
+
+    return None
 
-def _all_handlers():
-    """return a list of handler stored in .blend""" 
-    for oh in bpy.app.handlers:
-        if isinstance(oh, Iterable):
-            for h in oh:
-                yield h
+def _cost_record(tab:dict, kind:str, duration:float):
+    """accumulate the ui cost of a tab, per kind in ('poll','header','draw','panel_poll',). 
+    Stored on the tab record, shared by all module instances. See 'get_customtab_costs'"""
+
+    costs = tab.setdefault('costs', {})
+    entry = costs.get(kind)
+    if (entry is None):
+        entry = costs[kind] = [0, 0.0]
+
+    entry[0] += 1
+    entry[1] += duration
+
+    return None
+
+def _cost_call(uniqueid:str, kind:str, fct, *args, **kwargs):
+    """call a function of a tab, and accumulate its cost when the stats of our engine are enabled"""
+
+    if (not getattr(_engine(),'STATS_ENABLED',False)):
+        return fct(*args, **kwargs)
+
+    t = time.perf_counter()
+    try:
+        return fct(*args, **kwargs)
+    finally:
+        tab = _get_tab(uniqueid)
+        if (tab is not None):
+            _cost_record(tab, kind, time.perf_counter()-t)
+
+def _instrumented(name:str):
+    """decorator, measure the function execution when stats are enabled. 
+    When disabled, only costs a global lookup"""
+
+    def decorator(fct):
+        @functools.wraps(fct)
+        def wrapper(*args, **kwargs):
+            if (not STATS_ENABLED):
+                return fct(*args, **kwargs)
+            t = time.perf_counter()
+            try:
+                return fct(*args, **kwargs)
+            finally:
+                _stats_record(name, time.perf_counter()-t)
+        return wrapper
+
+    return decorator
+
+# Many module instances might be loaded, one per add-on hosting this file. The newest registered instance is elected as 
+# our engine, and serves all calls, with its own caches. See '_elect_engine'.
+# Module globals holding runtime state owned by the engine, handed over to the next engine:
+ENGINE_STATE = (
+    'NATIVE_NAVDRAW',
+    'ORIGINAL_CLASSES',
+    'PATCHED_CLASSES',
+    'TOOL_IMPOSTORS',
+    'PANELS_INDEXED',
+    'PANELS_BY_CATEGORY',
+    'PANELS_CHILDREN',
+    'PANELS_PENDING',
+    )
+
+# this module instance
+_THIS = sys.modules[__name__]
+
+def _engine():
+    """the module instance serving all calls"""
+    return getattr(bpy.types.WindowManager,'TabCustv1Engine',None) or _THIS
+
+def _engines() -> list:
+    """all the registered module instances, shared by all instances"""
+
+    engines = getattr(bpy.types.WindowManager,'TabCustv1Engines',None)
+    if (engines is None):
+        engines = bpy.types.WindowManager.TabCustv1Engines = []
+
+    return engines
+
+def _module_instances() -> list:
+    """all the loaded instances of this module, registered or not, including older ones that don't take part in our election"""
+
+    return [
+        m for m in list(sys.modules.values())
+        if isinstance(m, types.ModuleType) and ('module_info' in vars(m)) and ('_reg_nav_impostors' in vars(m))
+        ]
+
+def _elect_engine():
+    """elect the newest registered module instance as engine. It inherits the runtime state of the previous engine"""
+
+    previous = getattr(bpy.types.WindowManager,'TabCustv1Engine',None)
+    candidates = _engines()
+
+    if (not candidates):
+        bpy.types.WindowManager.TabCustv1Engine = None
+        return None
+
+    newest = max(candidates, key=lambda m: tuple(m.module_info['version']))
+    if (previous in candidates) and (tuple(previous.module_info['version']) >= tuple(newest.module_info['version'])):
+        return None
+
+    if (previous is not None) and hasattr(newest,'_takeover'):
+        newest._takeover(previous)
+
+    bpy.types.WindowManager.TabCustv1Engine = newest
+    _dprint(f"Engine: elected {newest.__name__} {newest.module_info['version']}")
+
+    return None
+
+def _takeover(previous):
+    """inherit the runtime state owned by the previous engine"""
+
+    for name in ENGINE_STATE:
+        if hasattr(previous, name):
+            globals()[name] = getattr(previous, name)
+
+    #our index of the spaces is empty, the slots of the pool would be unreachable until our next discovery
+    _get_space_index(refresh=True)
+
+    return None
+
+def _delegated(fct):
+    """decorator, forward the call to the same function of our engine, if we are not the engine. 
+    Our hooks (handlers, timers, impostors) are installed by the engine, see '_reg_runtime'"""
+
+    name = fct.__name__
+
+    @functools.wraps(fct)
+    def wrapper(*args, **kwargs):
+        engine = _engine()
+        if (engine is not _THIS):
+            return getattr(engine, name, fct)(*args, **kwargs)
+        return fct(*args, **kwargs)
+
+    return wrapper
 
 def _get_dataicon_fromcontext(obj=None) -> str:
     """Return a DATA icon corresponding to the object data type. Will use context.obj if None"""
@@ -279,31 +460,52 @@ def _get_dataicon_fromcontext(obj=None) -> str:
 
 def get_customtab_propname(space) -> str:
     """get the customtab window_manager.TabCustEnumProperty propname depending on the given space.
-    Each of your properties space will consequently generate a new window_manager.enum with an unique 
-    propname depending on your space memory adress."""
+    Each of your properties space is assigned to a window_manager.enum slot from a shared pool, 
+    depending on your space stable key, see '_space_key'. Will return None if the space has no slot yet."""
 
     if (space.type != 'PROPERTIES'):
         print(f"WARNING: Given space is not of type 'PROPERTIES'\nFrom module instance: {__file__}")
         return None
 
-    moduleidentifier = 'TabCustv1'
-    memadress = space.as_pointer()
+    idx = _get_slotpool()['spaces'].get(_space_key(space))
+    if (idx is None):
+        return None
 
-    return f'{moduleidentifier}_enum{memadress}'
+    return _slot_propname(idx)
 
 def get_customtab_value(space):
     """Get the window_manager.TabCustEnumProperty value equivalent for a given space. 
-    Each of your properties space will consequently generate a new window_manager.enum with an unique name.
-    Will return None if not found"""
+    Each of your properties space is assigned to a window_manager.enum slot from a shared pool, see 'get_customtab_propname'.
+    Will return None if not found, or if the space has no slot yet"""
 
     if (space.type != 'PROPERTIES'):
         print(f"WARNING: Given space is not of type 'PROPERTIES'\nFrom module instance: {__file__}")
         return None
 
-    wm = bpy.context.window_manager
     dynpropname = get_customtab_propname(space)
+    if (dynpropname is None):
+        return None
+
+    wm = bpy.context.window_manager
     return getattr(wm,dynpropname,None)
 
+# Resolved active tab per space memory adress, so all the panels polls of a redraw only pay a dict lookup.
+# Invalidated when a tab is selected, when enum items are re-generated, on depsgraph updates and on slot changes.
+ACTIVETAB_CACHE = {}
+
+@_delegated
+def _get_active_tab(space):
+    """cached equivalent of 'get_customtab_value', for our patched polls and draws"""
+
+    ptr = space.as_pointer()
+    if (ptr in ACTIVETAB_CACHE):
+        return ACTIVETAB_CACHE[ptr]
+
+    val = ACTIVETAB_CACHE[ptr] = get_customtab_value(space)
+    return val
+
+@_delegated
+@_instrumented('sync_spacecontext')
 def sync_spacecontext(propname, context=None,):
     """Ensure Properties space.context Enum value is in sync with their window_manager.TabCustEnumProperty counterpart"""
 
@@ -311,18 +513,34 @@ def sync_spacecontext(propname, context=None,):
         context = bpy.context
 
     wm = context.window_manager
-    selected = getattr(wm, propname)
+    selected = uniqueid = getattr(wm, propname)
+
+    # the active tab changed
+    ACTIVETAB_CACHE.clear()
 
     # If the user chose a custom enum entry, then we set the active tab to tool.
     # all custom panels use the tool tab 
     if (selected not in NATIVE_IDS):
+        # the tab panels might not be registered yet
+        _ensure_tab_panels(selected)
         selected = 'TOOL'
 
     # we synchronize context value
-    for s in _all_properties_spaces(context):
-        spacepropid = get_customtab_propname(s)
-        if (spacepropid == propname):
-            s.context = selected
+    index = _get_space_index(context)
+    ptr = index['propnames'].get(propname)
+
+    #the editor might be brand new, or its slot reassigned, our index is refreshed on layout changes only
+    if (ptr is None) or (get_customtab_propname(index['spaces'][ptr][2]) != propname):
+        index = _get_space_index(context, refresh=True)
+        ptr = index['propnames'].get(propname)
+        if (ptr is None):
+            return None
+
+    w, a, space = index['spaces'][ptr]
+    space.context = selected
+
+    # remember the custom tab for the next file reload
+    _persist_tab(w.screen, SPACE_KEYS.get(ptr), None if (uniqueid in NATIVE_IDS) else uniqueid)
 
     return None
 
@@ -335,9 +553,9 @@ def sync_customtab(space,):
     dynpropname = get_customtab_propname(space)
     wm = bpy.context.window_manager
 
-    current_val = getattr(wm,dynpropname,None)
+    current_val = getattr(wm,dynpropname,None) if dynpropname else None
     if (current_val is None):
-        print(f"WARNING: sync_customtab() didn't find prop '{dynpropname}'. Set kwarg 'create_prop_if_needed' to True, in order to create it if needed.\nFrom module instance: {__file__}")
+        print(f"WARNING: sync_customtab() the given space has no enum slot yet, it is assigned once the editor is discovered.\nFrom module instance: {__file__}")
         return None
 
     if (current_val != space.context):
@@ -346,63 +564,681 @@ def sync_customtab(space,):
     return None
 
 
-def _generate_enumitems(context, space) -> list:
-    """generate an enum list depending on context space and encoded globals"""
+# Incremented by 'invalidate', part of our enum items signature
+INVALIDATION_VERSION = 0
 
-    if (space is None):
-        return None
-    if (space.type!='PROPERTIES'):
+def _visible_tabs(items) -> tuple:
+    return tuple(t[0] for t in (items or ()) if t)
+
+def _tag_region(area, regiontype:str):
+    for r in area.regions:
+        if (r.type == regiontype):
+            r.tag_redraw()
+    return None
+
+@_delegated
+def invalidate(uniqueid:str=None):
+    """Tell the Properties editors that your tab changed: its poll inputs changed, or it has been added or removed. 
+    Pass the `uniqueid` of your tab, or None to invalidate all tabs. 
+    Only the editors whose visible tabs actually changed get their navigation bar redrawn, 
+    and only the editors displaying your tab get their content redrawn"""
+
+    global INVALIDATION_VERSION
+
+    if (uniqueid is None):
+        POLL_CACHE.clear()
+    else:
+        for k in [k for k in POLL_CACHE if (k[0]==uniqueid)]:
+            del POLL_CACHE[k]
+
+    INVALIDATION_VERSION += 1
+    ACTIVETAB_CACHE.clear()
+
+    context = bpy.context
+    for ptr, (w, a, space) in _get_space_index(context, verify=True)['spaces'].items():
+
+        cached = ENUMITEMS_CACHE.get(ptr)
+        #this editor never drawn our tabs
+        if (cached is None):
+            continue
+
+        #re-generate the items in the context of this editor, and compare
+        region = next((r for r in a.regions if (r.type=='NAVIGATION_BAR')), None)
+        with context.temp_override(window=w, area=a, region=region):
+            before = _visible_tabs(cached[1])
+            after = _visible_tabs(_generate_enumitems(bpy.context, space))
+            active = get_customtab_value(space)
+
+        if (before != after):
+            _tag_region(a, 'NAVIGATION_BAR')
+        if (uniqueid is None) or (active == uniqueid) or (before != after):
+            if (space.context == 'TOOL'):
+                _tag_region(a, 'WINDOW')
+        continue
+
+    return None
+
+def _invalidatefunc():
+    """one shot timer, invalidate once after many registry changes"""
+
+    invalidate()
+
+    return None
+
+@_delegated
+def _request_invalidate():
+    """invalidate as soon as possible, many changes requested at once will result in a single invalidation"""
+
+    if (_is_headless()):
         return None
-    if not hasattr(space,'context'):
-        print(f"WARNING: space {space} has no 'context' attribute. This should never happen.\nFrom module instance: {__file__}")
+
+    if not bpy.app.timers.is_registered(_invalidatefunc):
+        bpy.app.timers.register(_invalidatefunc, first_interval=0.0)
+
+    return None
+
+@_delegated
+def get_customtab_memstats() -> dict:
+    """Get statistics about the properties and caches of this module, useful to verify that memory stays flat over long sessions.
+    Python memory is only reported if 'tracemalloc' is tracing"""
+
+    pool = _get_slotpool()
+    idprops = sum(1 for wm in bpy.data.window_managers for k in wm.keys() if k.startswith(('TabCustv1_enum','TabCustv1_slot')))
+
+    return {
+        'slots': pool['size'],
+        'slots_used': len(pool['spaces']),
+        'legacy_properties': len(_dynamic_propnames()),
+        'idproperties': idprops,
+        'live_spaces': len(_live_spaces()),
+        'reclaimed': RECLAIM_STATS['reclaimed'],
+        'sweeps': RECLAIM_STATS['sweeps'],
+        'caches': {
+            'enumitems': len(ENUMITEMS_CACHE),
+            'enumitems_shared': len(ENUMITEMS_SHARED),
+            'nativetabs': len(NATIVE_TABS_CACHE),
+            'polls': len(POLL_CACHE),
+            'activetabs': len(ACTIVETAB_CACHE),
+            },
+        'python_memory': tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else None,
+        }
+
+@_delegated
+def enable_customtab_stats(enable:bool=True, reset:bool=False, show_costs:bool=False):
+    """Enable or disable the measurement of this module hot paths (enum generation, tab polls, header draws, handlers..), 
+    and of the ui cost of each tab, see `get_customtab_costs()`. Pass `reset` to forget the previous measurements. 
+    Pass `show_costs` to display the owners ranked by ui cost in the header of the custom tabs. Cheap enough to be left enabled in production"""
+
+    global STATS_ENABLED, STATS_SHOW_COSTS
+
+    STATS_ENABLED = enable
+    STATS_SHOW_COSTS = show_costs
+    if (reset):
+        STATS.clear()
+        for d in _get_registry():
+            if (type(d) is dict):
+                d.pop('costs', None)
+
+    return None
+
+@_delegated
+def get_customtab_stats() -> dict:
+    """Get a snapshot of this module measurements. Durations are in milliseconds, 
+    histograms are keyed by their upper bound in microseconds"""
+
+    timings = {}
+    for name, (count, total, maxi, histo) in STATS.items():
+        timings[name] = {
+            'count': count,
+            'total_ms': total*1000,
+            'mean_ms': (total/count)*1000 if count else 0.0,
+            'max_ms': maxi*1000,
+            'histogram': {f'<{2**i}us':n for i,n in enumerate(histo) if n},
+            }
+
+    return {
+        'enabled': STATS_ENABLED,
+        'timings': timings,
+        'counters': {
+            'depsgraph_handler': dict(HANDLER_GATE_STATS),
+            'reclaim': dict(RECLAIM_STATS),
+            },
+        'owners': get_customtab_costs(),
+        }
+
+def get_customtab_costs() -> list:
+    """Get the owners of the tabs (the add-ons that appended them), ranked by their ui cost, measured while stats are enabled.
+    Each owner gives its cumulative time in milliseconds and its amount of calls, with the detail per tab, 
+    and per kind in ('poll','header','draw','panel_poll',)"""
+
+    owners = {}
+
+    for d in _get_registry():
+        if (type(d) is not dict):
+            continue
+
+        name = d.get('owner') or 'unknown'
+        owner = owners.get(name)
+        if (owner is None):
+            owner = owners[name] = {'owner':name, 'total_ms':0.0, 'calls':0, 'tabs':{},}
+
+        tabcosts = owner['tabs'][d['id']] = {}
+        for kind, (calls, total) in d.get('costs',{}).items():
+            tabcosts[kind] = {'calls':calls, 'total_ms':total*1000}
+            owner['total_ms'] += total*1000
+            owner['calls'] += calls
+
+    return sorted(owners.values(), key=lambda o: o['total_ms'], reverse=True)
+
+@_delegated
+def _draw_costs_header(layout):
+    """debug line, the owners ranked by ui cost. See `enable_customtab_stats(show_costs=True)`"""
+
+    if (not STATS_SHOW_COSTS):
         return None
 
-    # get the available tabs depending on the current context.
+    ranked = [o for o in get_customtab_costs() if o['calls']][:3]
+    text = "   ".join(f"{o['owner']} {o['total_ms']:.1f}ms" for o in ranked)
+    layout.label(text=text or "No tab costs measured yet", icon='TIME')
+
+    return None
+
+def dump_customtab_stats(filepath:str):
+    """Dump a snapshot of this module measurements to a json file"""
+
+    with open(filepath, 'w') as f:
+        json.dump(get_customtab_stats(), f, indent=4)
+
+    return None
+
+# Data providers, computing the expensive data of tabs draw callbacks out of the ui drawing. See 'register_provider'
+PROVIDERS = {}
+PROVIDER_POOL = None
+PROVIDER_TIMER_INTERVAL = 0.05 #how often we check on running jobs, in seconds
+PROVIDER_CHUNK_BUDGET = 0.005  #how long the chunked jobs can run per timer tick, in seconds
+
+def register_provider(name:str, compute, tab:str=None, threaded:bool=False, ttl:float=None):
+    """Register a data provider, computing expensive data for your tab `draw` or `header` callbacks out of the ui drawing.
+    You must pass:
+        `name` (string) unique name of your provider,
+        `compute` (function) without arguments, returning your data.
+    with optional arguments:
+        `threaded` (bool) if True, `compute` runs on a thread pool, it must NOT touch bpy then! 
+            Otherwise it runs on the main thread from a timer, and can be a generator yielding between chunks of work, returning your data.
+        `tab` (string) uniqueid of the tab displaying the data. Only the editors displaying this tab are redrawn when new data arrives.
+        `ttl` (float) seconds before the data is outdated and computed again. If None, only `invalidate_provider()` outdates it.
+    Then use `get_provider_data(name)` from your draw callbacks, it returns the last data right away, and computes it again if needed.
+    """
+
+    if (name in PROVIDERS):
+        raise Exception(f"The provider '{name}' is already registered.")
+    if not callable(compute):
+        raise Exception(f"Provider '{name}': Please pass a callable 'compute' function.")
+
+    PROVIDERS[name] = {
+        'compute':compute,
+        'tab':tab,
+        'threaded':threaded,
+        'ttl':ttl,
+        'version':0,      #bumped by 'invalidate_provider'
+        'job':None,       #running future or generator
+        'job_version':0,  #version of the running job
+        'data':None,
+        'data_version':-1,
+        'data_time':None,
+        }
+
+    return None
+
+def remove_provider(name:str):
+    """Remove a data provider, its running job result will be ignored"""
+
+    p = PROVIDERS.pop(name, None)
+    if (p is not None):
+        _cancel_job(p)
+
+    return None
+
+def invalidate_provider(name:str):
+    """Outdate the data of a provider, it will be computed again the next time it's requested"""
+
+    p = PROVIDERS.get(name)
+    if (p is None):
+        raise Exception(f"Unknown provider '{name}'.")
+
+    p['version'] += 1
+
+    return None
+
+def get_provider_data(name:str, default=None):
+    """Get the last data of a provider right away, `default` if never computed yet. 
+    If the data is outdated, a new computation is started in the background"""
+
+    p = PROVIDERS.get(name)
+    if (p is None):
+        raise Exception(f"Unknown provider '{name}'.")
+
+    if (p['job'] is None) and not _is_provider_fresh(p):
+        _start_job(p)
+
+    if (p['data_time'] is None):
+        return default
+
+    return p['data']
+
+def _is_provider_fresh(p) -> bool:
+
+    if (p['data_version'] != p['version']):
+        return False
+    if (p['ttl'] is not None) and (time.monotonic()-p['data_time'] > p['ttl']):
+        return False
+
+    return True
+
+def _as_generator(compute):
+    """run the compute function step by step, a plain function is a single step"""
+
+    data = compute()
+    if isinstance(data, types.GeneratorType):
+        data = yield from data
+
+    return data
+
+def _get_provider_pool():
+
+    global PROVIDER_POOL
+
+    if (PROVIDER_POOL is None):
+        PROVIDER_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='customtab')
+
+    return PROVIDER_POOL
+
+def _start_job(p):
+    """start computing the data of a provider, we collect the results from our timer"""
+
+    p['job_version'] = p['version']
+
+    if (p['threaded']):
+          p['job'] = _get_provider_pool().submit(p['compute'])
+    else: p['job'] = _as_generator(p['compute'])
+
+    if not bpy.app.timers.is_registered(_providersfunc):
+        bpy.app.timers.register(_providersfunc, first_interval=0.0, persistent=True)
+
+    return None
+
+def _cancel_job(p):
+
+    job, p['job'] = p['job'], None
+    match job:
+        case None:
+            pass
+        case types.GeneratorType():
+            job.close()
+        case _:
+            job.cancel()
+
+    return None
+
+def _reset_providers():
+    """cancel the running jobs and outdate all data, they were computed from the file being unloaded"""
+
+    for p in PROVIDERS.values():
+        _cancel_job(p)
+        p['version'] += 1
+
+    return None
+
+def _providersfunc():
+    """timer, collect the results of our threaded providers, and advance the chunked ones. Stops when there's nothing left to do"""
+
+    busy = False
+
+    for name, p in list(PROVIDERS.items()):
+
+        job = p['job']
+        if (job is None):
+            continue
+
+        try:
+            if (p['threaded']):
+                if not job.done():
+                    busy = True
+                    continue
+                data = job.result()
+
+            else:
+                t = time.perf_counter()
+                while (time.perf_counter()-t < PROVIDER_CHUNK_BUDGET):
+                    next(job)
+                busy = True
+                continue
+
+        except StopIteration as e:
+            data = e.value
+
+        except Exception as e:
+            print(f"WARNING: Provider '{name}' failed.\n{e}\nFrom module instance: {__file__}")
+            p['job'] = None
+            continue
+
+        p['job'] = None
+        p['data'] = data
+        p['data_version'] = p['job_version']
+        p['data_time'] = time.monotonic()
+
+        _tag_tab_areas(p['tab'])
+        continue
+
+    return PROVIDER_TIMER_INTERVAL if busy else None
+
+@_delegated
+def _tag_tab_areas(uniqueid:str=None):
+    """redraw the content of the editors displaying the given custom tab, or any custom tab if None"""
+
+    wm = bpy.context.window_manager
+
+    for ptr, (w, a, space) in _get_space_index(verify=True)['spaces'].items():
+
+        if (space.context != 'TOOL'):
+            continue
+
+        if (uniqueid is not None):
+            #we can't rely on the context from a timer, we read the raw slot value
+            cached, propname = ENUMITEMS_CACHE.get(ptr), get_customtab_propname(space)
+            if (cached is None) or (propname is None):
+                continue
+            idx = wm.get(propname, 0)
+            if not any((type(t) is tuple) and (t[4]==idx) and (t[0]==uniqueid) for t in cached[1]):
+                continue
+
+        _tag_region(a, 'WINDOW')
+        continue
+
+    return None
+
+# Cache of the final enum items per space pointer, alongside the signature they were generated from.
+# Blender requires python to keep a reference of the strings of a dynamic enum, this cache also ensure that.
+ENUMITEMS_CACHE = {}
+
+# Enum items shared by the unpinned editors, per signature. Most of the time these editors share the same context,
+# so their items only need to be built once. Pinned editors do not share, their context is their own.
+ENUMITEMS_SHARED = {}
+ENUMITEMS_SHARED_MAX = 16
+
+# Cache of the native tabs available, per native context key.
+NATIVE_TABS_CACHE = {}
+
+# Did we verify that our resolver agrees with blender? None if not verified yet.
+NATIVE_RESOLVER_VALID = None
+
+def _probe_native_tabs(space) -> frozenset:
+    """get the native tabs available for this space, by asking blender. Slow, only used as a fallback.
+    Will return None if the probe failed"""
+
     # Unfortunately, there's no way to get the context enum of the space.. 
     # so we get it via the error message.. I don't like this.. but it works..
     try: space.context = 'HEYDUDE'
     except Exception as e:
         # NOTE if blender developers change how the error message is generated, this will break.
         msg = str(e) #ex: `bpy_struct: item.attr = val: enum "HEYDUDE" not found in ('TOOL', 'RENDER',)`
+        if ("not found in (" not in msg):
+            return None
         tuplestr = msg.split("not found in (")[1].replace(')','')
-        tabs_available = set(tuplestr.replace("'",'').replace(' ','').split(","))
-    
-    # Here below we merge the native items with the user items, following the group order.
-    native_items = list(NATIVE_ITEMS)
-    for v in native_items:
-        v['native'] = True
-    merged_items = native_items.copy()
-    # Find the last index for each group
-    gridx = {}
-    for i, item in enumerate(merged_items):
-        if (item):
-            gridx[item['group']] = i
-    # Insert user items after the last item of the same group
+        return frozenset(tuplestr.replace("'",'').replace(' ','').split(","))
+
+    return None
+
+def _resolve_native_tabs(context, space) -> frozenset:
+    """compute the native tabs available for this space, mirroring blender 'buttons_context' rules"""
+
+    return frozenset(
+        e['id']
+        for e in NATIVE_ITEMS
+        if (type(e) is dict) and getattr(space, NATIVE_SHOWFLAGS[e['id']], True) and e['poll'](context)
+        )
+
+def _native_context_key(context, space) -> tuple:
+    """everything the native tabs availability depends on"""
+
+    obj = context.active_object
+    pin = space.pin_id
+
+    return (
+        pin.as_pointer() if pin else None,
+        obj.type if obj else None,
+        obj.mode if obj else None,
+        context.active_bone is not None,
+        _poll_collection(context),
+        tuple(getattr(space, n, True) for n in NATIVE_SHOWFLAGS.values()),
+        )
+
+def _verify_native_resolver(context, space) -> bool:
+    """compare our resolver with blender, if they don't agree we'll use the slow probe from now on"""
+
+    global NATIVE_RESOLVER_VALID
+
+    probed = _probe_native_tabs(space)
+    resolved = _resolve_native_tabs(context, space)
+
+    # if the probe itself is broken, the resolver is all we have.
+    if (probed is None):
+        print(f"WARNING: Couldn't ask blender for the available tabs. Relying on customtab native tabs rules.\nFrom module instance: {__file__}")
+        NATIVE_RESOLVER_VALID = True
+        return True
+
+    NATIVE_RESOLVER_VALID = (probed==resolved)
+    if (not NATIVE_RESOLVER_VALID):
+        print(f"WARNING: customtab native tabs rules don't match this blender version: {sorted(probed^resolved)}. Falling back on the slower probe.\nFrom module instance: {__file__}")
+
+    return NATIVE_RESOLVER_VALID
+
+def _get_native_tabs(context, space) -> frozenset:
+    """get the native tabs available for this space, computed once per context change"""
+
+    key = _native_context_key(context, space)
+    tabs = NATIVE_TABS_CACHE.get(key)
+    if (tabs is not None):
+        return tabs
+
+    pinned = (key[0] is not None)
+
+    # verify our resolver on the first unpinned editor we encounter, 
+    # in practice, this happens on the very first timer execution at startup.
+    if (NATIVE_RESOLVER_VALID is None) and (not pinned):
+        _verify_native_resolver(context, space)
+
+    # pinned editors don't follow the context rules, we ask blender instead.
+    if (pinned or not NATIVE_RESOLVER_VALID):
+        tabs = _probe_native_tabs(space)
+    if (tabs is None):
+        tabs = _resolve_native_tabs(context, space)
+
+    NATIVE_TABS_CACHE[key] = tabs
+    _dprint(f"NativeTabsCache: {'probed' if (pinned or not NATIVE_RESOLVER_VALID) else 'resolved'} {sorted(tabs)}")
+
+    return tabs
+
+# Tabs can opt-in to cache their poll results, declaring what their poll depends on.
+# These are the possible invalidation keys.
+POLL_CACHE_KEYS = {
+    'ACTIVE_OBJECT': lambda context: context.active_object.as_pointer() if context.active_object else None,
+    'MODE':          lambda context: context.mode,
+    'SELECTION':     lambda context: tuple(o.as_pointer() for o in context.selected_objects),
+    'SCENE':         lambda context: context.scene.as_pointer(),
+    'FRAME':         lambda context: context.scene.frame_current,
+    }
+
+# Cached poll results, per (uniqueid, window memory adress), storing (invalidation keys values, poll function, result).
+# Shared by all the editors of a window, an entry is replaced as soon as its keys values change.
+POLL_CACHE = {}
+
+def _run_tab_poll(tab, context) -> bool:
+    """execute the poll function of a tab"""
+
+    if (STATS_ENABLED):
+        t = time.perf_counter()
+
+    try:
+        result = bool(tab['poll'](context))
+    except Exception as e:
+        print(f"WARNING: tab '{tab['id']}' poll function failed!\n{e}\nFrom module instance: {__file__}")
+        result = False
+
+    if (STATS_ENABLED):
+        duration = time.perf_counter()-t
+        _stats_record(f"tab_poll:{tab['id']}", duration)
+        _cost_record(tab, 'poll', duration)
+
+    return result
+
+def _get_hidden_tabs(context) -> frozenset:
+    """run the poll function of all registry tabs, return the ids of the tabs that should be hidden"""
+
+    hidden = set()
+    keysvalues = {} #invalidation keys values are only evaluated once, if needed.
+    window = context.window
+    wptr = window.as_pointer() if window else None
+
+    for v in _get_registry():
+        if (v is None) or (not v['poll']):
+            continue
+
+        # tab without poll cache, we always poll
+        cachekeys = v.get('poll_cache')
+        if (not cachekeys):
+            if (not _run_tab_poll(v, context)):
+                hidden.add(v['id'])
+            continue
+
+        for k in cachekeys:
+            if (k not in keysvalues):
+                keysvalues[k] = POLL_CACHE_KEYS[k](context)
+        values = tuple(keysvalues[k] for k in cachekeys)
+
+        entry = POLL_CACHE.get((v['id'], wptr))
+        if (entry is not None) and (entry[0]==values) and (entry[1] is v['poll']):
+            result = entry[2]
+        else:
+            result = _run_tab_poll(v, context)
+            POLL_CACHE[(v['id'], wptr)] = (values, v['poll'], result)
+
+        if (not result):
+            hidden.add(v['id'])
+        continue
+
+    return frozenset(hidden)
+
+@_delegated
+@_instrumented('generate_enumitems')
+def _generate_enumitems(context, space) -> list:
+    """generate an enum list depending on context space and encoded globals. 
+    The list is cached per space and only re-generated when its signature changed, unpinned spaces share their lists"""
+
+    if (space is None):
+        return None
+    if (space.type!='PROPERTIES'):
+        return None
+    if not hasattr(space,'context'):
+        print(f"WARNING: space {space} has no 'context' attribute. This should never happen.\nFrom module instance: {__file__}")
+        return None
+
+    # get the available tabs depending on the current context.
+    tabs_available = _get_native_tabs(context, space)
+    hidden_tabs = _get_hidden_tabs(context)
+
+    # everything our items depends on
+    obj = context.active_object
+    signature = (
+        _get_registry_version(),
+        INVALIDATION_VERSION,
+        tabs_available,
+        hidden_tabs,
+        obj.type if obj else None,
+        context.mode,
+        _get_dataicon_fromcontext(obj) if obj else None,
+        _poll_collection(context),
+        )
+
+    ptr = space.as_pointer()
+    cached = ENUMITEMS_CACHE.get(ptr)
+    if (cached is not None) and (cached[0]==signature):
+        return cached[1]
+
+    # another unpinned editor might have built these items already
+    shared = (space.pin_id is None)
+    items = ENUMITEMS_SHARED.get(signature) if shared else None
+    if (items is None):
+        items = _build_enumitems(context, tabs_available, hidden_tabs)
+        if (shared):
+            # the lists stay referenced by ENUMITEMS_CACHE, we can forget old signatures safely
+            if (len(ENUMITEMS_SHARED) >= ENUMITEMS_SHARED_MAX):
+                ENUMITEMS_SHARED.clear()
+            ENUMITEMS_SHARED[signature] = items
+
+    ENUMITEMS_CACHE[ptr] = (signature, items)
+
+    # the stored enum index might point to another tab now
+    ACTIVETAB_CACHE.pop(ptr, None)
+    _dprint(f"EnumItemsCache: generated items for space {ptr}")
+
+    return items
+
+# The ordering plan is a flat tuple of (item, group, is_native), native and registry items merged following the group order.
+# It only changes when the registry changes, so we store it alongside the registry version it was built from.
+ORDERING_PLAN = (-1, ())
+
+def _build_ordering_plan() -> tuple:
+    """merge the native items with the registry items, following the group order"""
+
+    # Regroup registry items per group, in registration order
+    usergroups = {}
     for v in _get_registry():
         #None used to me manual spacers.
         if (v is None):
             continue
-        g = v['group']
-        if g in gridx:
-            # Insert after the last item of the same group
-            insert_index = gridx[g] + 1
-            merged_items.insert(insert_index, v)
-            # Update indices for all groups
-            for i in gridx:
-                if (gridx[i] >= insert_index):
-                    gridx[i] += 1
-            # Update this group's last index
-            gridx[g] = insert_index
-        else:
-            # If group not found, append to the end
-            merged_items.append(v)
-            gridx[g] = len(merged_items) - 1
+        usergroups.setdefault(v['group'], []).append(v)
+
+    # Find the last native item of each group
+    lastnative = {}
+    for i, e in enumerate(NATIVE_ITEMS):
+        lastnative[e['group']] = i
+
+    # User items are inserted after the last item of the same group
+    plan = []
+    for i, e in enumerate(NATIVE_ITEMS):
+        plan.append((e, e['group'], True))
+        if (lastnative[e['group']] == i):
+            for v in usergroups.pop(e['group'], ()):
+                plan.append((v, v['group'], False))
+
+    # If group not found, append to the end
+    for g, items in usergroups.items():
+        for v in items:
+            plan.append((v, g, False))
+
+    return tuple(plan)
+
+def _get_ordering_plan() -> tuple:
+    """get the ordering plan, rebuilt only if the registry changed"""
+
+    global ORDERING_PLAN
+
+    version = _get_registry_version()
+    if (ORDERING_PLAN[0] != version):
+        ORDERING_PLAN = (version, _build_ordering_plan())
+        _dprint(f"OrderingPlan: rebuilt for registry version {version}")
+
+    return ORDERING_PLAN[1]
+
+def _build_enumitems(context, tabs_available, hidden_tabs) -> list:
+    """build the enum items list from the ordering plan"""
 
     # Generate enum items based on context polling rather than try-except
     r, i, activegr = [], 0, None
-    for v in merged_items:
+    for v, group, native in _get_ordering_plan():
 
-        uniqueid, icon, poll, group, native = v['id'], v['icon'], v['poll'], v['group'], v.get('native',False)
+        uniqueid, icon = v['id'], v['icon']
 
         # filter out tabs that are not available in current context.
         if (native and (uniqueid not in tabs_available)):
@@ -416,14 +1252,9 @@ def _generate_enumitems(context, space) -> list:
                 if not _poll_collection(context):
                     continue
 
-        # support for tab poll functions
-        if (poll):
-            try:
-                if (not poll(context)):
-                    continue
-            except Exception as e:
-                print(f"WARNING: tab '{uniqueid}' poll function failed!\n{e}\nFrom module instance: {__file__}")
-                continue
+        # support for tab poll functions, already evaluated
+        if (uniqueid in hidden_tabs):
+            continue
 
         # Add spacer if group changes
         if ((activegr is not None) and (group != activegr)):
@@ -442,40 +1273,325 @@ def _generate_enumitems(context, space) -> list:
 
     return r
 
-def _reg_enumproperty_for_space(space):
-    """Dynamically register a Enumproperty on WindowManager using space.as_pointer() as name"""
+# Pool of tab EnumProperties registered on WindowManager as 'TabCustv1_slot<index>', shared by all module instances.
+# Properties spaces are assigned to a free slot, and release it when they are gone.
+# 'spaces' maps a space stable key to its slot index, 'free' are the released slot indexes.
+# 'owners' maps a space stable key to the memory adress of the space holding the slot, so slots can follow their space.
 
-    dynpropname = get_customtab_propname(space)
+def _get_slotpool() -> dict:
 
-    #no need to register if already exists!
-    if hasattr(bpy.types.WindowManager, dynpropname):
-        return None
+    pool = getattr(bpy.types.WindowManager,'TabCustv1SlotPool',None)
+    if (pool is None):
+        pool = bpy.types.WindowManager.TabCustv1SlotPool = {'spaces':{}, 'free':[], 'size':0, 'owners':{},}
+
+    #pools created by older module instances
+    elif ('owners' not in pool):
+        pool['owners'] = {}
+
+    return pool
 
-    current_items = _generate_enumitems(bpy.context, space)
-    default_idx = [t[4] for t in current_items if (type(t) is tuple) and (t[0]==space.context)][0]
+def _slot_propname(idx:int) -> str:
+    return f'TabCustv1_slot{idx}'
+
+@_instrumented('property_registration')
+def _reg_slot_property(idx:int):
+    """register a new EnumProperty slot on WindowManager"""
+
+    propname = _slot_propname(idx)
 
     prop = bpy.props.EnumProperty(
         name="",
-        default=default_idx,
         items=lambda self, context: _generate_enumitems(context, context.space_data),
-        update=lambda self, context: sync_spacecontext(dynpropname, context=context,),
+        update=lambda self, context: sync_spacecontext(propname, context=context,),
         )
 
-    _dprint(f"DynamicReg:{dynpropname}")
-    setattr(bpy.types.WindowManager, dynpropname, prop)
+    _dprint(f"SlotReg:{propname}")
+    setattr(bpy.types.WindowManager, propname, prop)
+
+    return None
+
+def _acquire_slot(key:tuple, ptr:int) -> int:
+    """assign a slot to the given space stable key, grow the pool if there are no free slots"""
+
+    pool = _get_slotpool()
+
+    if (pool['free']):
+        idx = pool['free'].pop()
+    else:
+        idx = pool['size']
+        _reg_slot_property(idx)
+        pool['size'] += 1
+
+    pool['spaces'][key] = idx
+    pool['owners'][key] = ptr
+    ACTIVETAB_CACHE.pop(ptr, None)
+
+    if (ptr in SPACE_INDEX['spaces']):
+        SPACE_INDEX['propnames'][_slot_propname(idx)] = ptr
+
+    return idx
+
+def _release_slot(key:tuple):
+    """free the slot of the given space stable key"""
+
+    pool = _get_slotpool()
+
+    pool['owners'].pop(key, None)
+    idx = pool['spaces'].pop(key, None)
+    if (idx is None):
+        return None
+
+    #forget the value of the previous user
+    propname = _slot_propname(idx)
+    for wm in bpy.data.window_managers:
+        if propname in wm:
+            del wm[propname]
+
+    pool['free'].append(idx)
+    ACTIVETAB_CACHE.clear()
+    SPACE_INDEX['propnames'].pop(propname, None)
+    _dprint(f"SlotRelease:{propname}")
 
     return None
 
-#Registry is a global list containing None or Dicts of strings or function we store on bpy.types.WindowManager
+def _follow_moved_spaces(live:dict):
+    """closing, joining or switching areas shift the stable keys of the spaces that follow. 
+    Move the slots, and the tabs persisted in the screens, along with their space. `live` maps the current keys to the space adresses"""
+
+    pool = _get_slotpool()
+    owners = pool['owners']
+    keyof = {ptr:key for key, ptr in live.items()}
+
+    moves = [(key, keyof[ptr]) for key, ptr in owners.items() if (ptr in keyof) and (keyof[ptr] != key)]
+    if (not moves):
+        return None
+
+    screens = {sc.name:sc for sc in bpy.data.screens}
+
+    #spaces might swap their keys, we pop everything first
+    slots, tabs = {}, {}
+    for old, new in moves:
+        slots[old] = pool['spaces'].pop(old, None)
+        owners.pop(old)
+        persisted = screens[old[0]].get(PERSIST_PROPNAME) if (old[0] in screens) else None
+        if (persisted is not None):
+            tabs[old] = persisted.pop(f"{old[1]}:{old[2]}", None)
+
+    for old, new in moves:
+
+        #the slot of a space that is gone
+        if (new in pool['spaces']):
+            _release_slot(new)
+            RECLAIM_STATS['reclaimed'] += 1
+
+        if (slots[old] is not None):
+            pool['spaces'][new] = slots[old]
+            owners[new] = live[new]
+
+        #the tab persisted for this key belonged to the space that is gone
+        if (new[0] in screens):
+            _persist_tab(screens[new[0]], new, tabs.get(old))
+
+        _dprint(f"SlotMove:{old}->{new}")
+        continue
+
+    ACTIVETAB_CACHE.clear()
+
+    return None
+
+@_instrumented('slot_assignment')
+def _reg_enumproperty_for_space(space):
+    """Assign an EnumProperty slot on WindowManager to this space, from its stable key.
+    Return True if the space got a new slot"""
+
+    key = _space_key(space)
+    if (key is None) or (key in _get_slotpool()['spaces']):
+        return False
+
+    _acquire_slot(key, space.as_pointer())
+
+    #the slot might have been used by another space before.
+    _init_slot_value(space)
+
+    return True
+
+def _init_slot_value(space):
+    """initialize the slot value of this space with its space.context"""
+
+    propname = get_customtab_propname(space)
+    if (propname is None):
+        return None
+
+    current_items = _generate_enumitems(bpy.context, space) or []
+    default_idx = next((t[4] for t in current_items if (type(t) is tuple) and (t[0]==space.context)), 0)
+    bpy.context.window_manager[propname] = default_idx
+
+    return None
+
+def _serve_legacy_instances():
+    """module instances predating the slot pool poll their panels on a 'TabCustv1_enum<ptr>' property we don't register anymore. 
+    We serve their lookups with our slots instead"""
+
+    for m in _module_instances():
+        if ('_get_slotpool' in vars(m)) or (m.get_customtab_value is get_customtab_value):
+            continue
+        _dprint(f"Legacy: serving {m.__name__} {m.module_info['version']}")
+        m.get_customtab_propname = get_customtab_propname
+        m.get_customtab_value = get_customtab_value
+        continue
+
+    return None
+
+# Statistics about our properties reclamation, see 'get_customtab_memstats'
+RECLAIM_STATS = {'sweeps':0, 'reclaimed':0,}
+
+def _live_spaces() -> dict:
+    """the stable keys of all existing properties spaces, from all screens, displayed or not, with their memory adresses"""
+
+    return {
+        (sc.name, i, j): s.as_pointer()
+        for sc in bpy.data.screens
+            for i, a in enumerate(sc.areas)
+                for j, s in enumerate(a.spaces)
+                    if (s.type == 'PROPERTIES')
+        }
+
+def _dynamic_propnames() -> list:
+    """all the per-space EnumProperties registered on the WindowManager, by older module instances"""
+
+    return [n for n in dir(bpy.types.WindowManager) if n.startswith('TabCustv1_enum')]
+
+def _reclaim_enumproperties():
+    """release the slots of spaces that don't exist anymore, 
+    and unregister the per-space EnumProperties older module instances might have created"""
+
+    live = _live_spaces()
+
+    #the spaces that moved keep their slot
+    _follow_moved_spaces(live)
+
+    screens = {sc.name:sc for sc in bpy.data.screens}
+
+    for key in [k for k in _get_slotpool()['spaces'] if (k not in live)]:
+        _release_slot(key)
+        #a space opened later at this key must not restore the tab of the closed one
+        if (key[0] in screens):
+            _persist_tab(screens[key[0]], key, None)
+        RECLAIM_STATS['reclaimed'] += 1
+
+    live = set(live.values())
+
+    for ptr in [p for p in ENUMITEMS_CACHE if (p not in live)]:
+        del ENUMITEMS_CACHE[ptr]
+
+    prefixlen = len('TabCustv1_enum')
+
+    for propname in _dynamic_propnames():
+
+        adress = propname[prefixlen:]
+        if (not adress.isdigit()) or (int(adress) in live):
+            continue
+
+        try:
+            delattr(bpy.types.WindowManager, propname)
+        except Exception as e:
+            print(f"WARNING: couldn't unregister property '{propname}'\n{e}\nFrom module instance: {__file__}")
+            continue
+
+        #some properties convert themselves to user props
+        for wm in bpy.data.window_managers:
+            if propname in wm:
+                del wm[propname]
+
+        ENUMITEMS_CACHE.pop(int(adress), None)
+
+        RECLAIM_STATS['reclaimed'] += 1
+        _dprint(f"DynamicUnreg:{propname}")
+        continue
+
+    RECLAIM_STATS['sweeps'] += 1
+
+    return None
+
+#Registry is a global index containing None or Dicts of strings or function we store on bpy.types.WindowManager
 #Similar struct to NATIVE_ITEMS, but with added header, poll functions
 
+class _TabRegistry:
+    """Ordered index of the tabs records, keyed by their uniqueid. 
+    Shared by all module instances, it also mimics the list API older module instances rely on"""
+
+    def __init__(self, items=()):
+        self.index = {}
+        for v in items:
+            self.append(v)
+
+    def __iter__(self):
+        return iter(self.index.values())
+
+    def __len__(self):
+        return len(self.index)
+
+    def get(self, uniqueid:str):
+        """get a tab record from its uniqueid, None if not found"""
+        return self.index.get(uniqueid)
+
+    def append(self, item):
+        #None used to be manual spacers, they need an unique key
+        key = item['id'] if (type(item) is dict) else object()
+        self.index[key] = item
+        _bump_registry_version()
+        return None
+
+    def extend(self, items):
+        """append many tab records at once, with a single version bump"""
+        for item in items:
+            key = item['id'] if (type(item) is dict) else object()
+            self.index[key] = item
+        _bump_registry_version()
+        return None
+
+    def discard(self, uniqueids):
+        """remove many tab records at once, with a single version bump. Return the removed records"""
+        items = [self.index.pop(u) for u in uniqueids if (u in self.index)]
+        if (items):
+            _bump_registry_version()
+        return items
+
+    def pop(self, uniqueid:str):
+        """remove a tab record from its uniqueid, return it, None if not found"""
+        item = self.index.pop(uniqueid, None)
+        if (item is not None):
+            _bump_registry_version()
+        return item
+
+    def remove(self, item):
+        if (type(item) is dict) and (self.index.get(item['id']) is item):
+            self.pop(item['id'])
+            return None
+        for k, v in self.index.items():
+            if (v is item):
+                del self.index[k]
+                _bump_registry_version()
+                return None
+        raise ValueError(f"{item} not in registry")
+
+    def clear(self):
+        self.index.clear()
+        _bump_registry_version()
+        return None
+
 def _get_registry():
-    wm = bpy.context.window_manager
 
-    if not hasattr(wm,'TabCustomv1Registry'):
-        bpy.types.WindowManager.TabCustomv1Registry = []
+    registry = getattr(bpy.types.WindowManager,'TabCustomv1Registry',None)
+
+    if (registry is None):
+        registry = bpy.types.WindowManager.TabCustomv1Registry = _TabRegistry()
 
-    return wm.TabCustomv1Registry
+    # an older module instance might have created the registry as a simple list
+    elif not hasattr(registry,'index'):
+        registry = bpy.types.WindowManager.TabCustomv1Registry = _TabRegistry(registry)
+
+    return registry
 
 def _del_registry():
     wm = bpy.context.window_manager
@@ -487,35 +1603,36 @@ def _del_registry():
     if hasattr(bpy.types.WindowManager,'TabCustomv1Registry'):
         del bpy.types.WindowManager.TabCustomv1Registry
 
-    return None
+    # the version is never reset, caches could confuse an old registry with a new one.
+    _bump_registry_version()
 
-def _append_registry(item):
-    _get_registry().append(item)
     return None
 
-def _remove_from_registry(uniqueid):
-    torem = None
-    registry = _get_registry()
-    for d in registry:
-        if (type(d) is dict):
-            if d['id']==uniqueid:
-                torem = d
-                break
-    if torem:
-        registry.remove(torem)
+def _get_registry_version() -> int:
+    """the registry version is incremented on each registry modification, used by our caches"""
+    return getattr(bpy.types.WindowManager,'TabCustomv1RegistryVersion',0)
+
+def _bump_registry_version():
+    bpy.types.WindowManager.TabCustomv1RegistryVersion = _get_registry_version() + 1
     return None
 
-def _existing_registry_ids():
-    for d in _get_registry():
-        if (type(d) is dict):
-            yield d['id']
+def _extend_registry(items):
+    _get_registry().extend(items)
+    _get_ordering_plan()
+    return None
 
-def _get_from_registry(uniqueid:str, attribute:str,):
-    for d in _get_registry():
-        if (type(d) is dict) and (d['id']==uniqueid):
-            return d.get(attribute)
+def _discard_from_registry(uniqueids):
+    uniqueids = set(uniqueids)
+    if (_get_registry().discard(uniqueids)):
+        _get_ordering_plan()
+    for k in [k for k in POLL_CACHE if (k[0] in uniqueids)]:
+        del POLL_CACHE[k]
     return None
 
+def _get_tab(uniqueid:str) -> dict:
+    """get the full record of a tab, None if not found"""
+    return _get_registry().get(uniqueid)
+
 # ooooo   ooooo                             .o8  oooo                              
 # `888'   `888'                            "888  `888                              
 #  888     888   .oooo.   ooo. .oo.    .oooo888   888   .ooooo.  oooo d8b  .oooo.o 
@@ -524,78 +1641,461 @@ def _get_from_registry(uniqueid:str, attribute:str,):
 #  888     888  d8(  888   888   888  888   888   888  888    .o  888     o.  )88b 
 # o888o   o888o `Y888""8o o888o o888o `Y8bod88P" o888o `Y8bod8P' d888b    8""888P' 
 
-#Private functions, please don't use them.
+#Private functions, please don't use them.
+
+# Our timer backs off when the screen layout doesn't change, and speeds up again after a layout edit.
+TIMER_INTERVAL_MIN = 0.4
+TIMER_INTERVAL_MAX = 4.0
+TIMER_INTERVAL = TIMER_INTERVAL_MIN
+
+# Last screen layout we've seen, see '_layout_fingerprint'
+LAYOUT_FINGERPRINT = None
+
+# Incremented each time the layout might have changed
+LAYOUT_GENERATION = 0
+
+# Stable identity of the displayed properties spaces, per memory adress. see '_space_key'
+SPACE_KEYS = {}
+
+# Index of the properties spaces displayed in our windows, see '_get_space_index'
+SPACE_INDEX = {
+    'generation':None,
+    'fingerprint':None,
+    'spaces':{},    #space pointer -> (window, area, space)
+    'propnames':{}, #slot propname -> space pointer
+    }
+
+def _get_space_index(context=None, refresh:bool=False, verify:bool=False) -> dict:
+    """the displayed properties spaces, by pointer and by their slot propname. Only rebuilt when the layout might have changed.
+    Pass `verify` when you are about to access all spaces outside of our timer, the layout might have changed since its last tick"""
+
+    if (context is None):
+        context = bpy.context
+
+    if (verify) and (SPACE_INDEX['fingerprint'] != _layout_fingerprint(context)):
+        refresh = True
+
+    if (SPACE_INDEX['generation'] == LAYOUT_GENERATION) and (not refresh):
+        return SPACE_INDEX
+
+    pool = _get_slotpool()
+    spaces, propnames, newowners = {}, {}, []
+
+    SPACE_KEYS.clear()
+
+    for w in context.window_manager.windows:
+        for i, a in enumerate(w.screen.areas):
+            if (a.type == 'PROPERTIES'):
+                for j, s in enumerate(a.spaces):
+                    if (s.type == 'PROPERTIES'):
+                        ptr = s.as_pointer()
+                        SPACE_KEYS[ptr] = (w.screen.name, i, j)
+                        spaces[ptr] = (w, a, s)
+
+    #the areas might have moved since, their slots follow them
+    _follow_moved_spaces({key:ptr for ptr, key in SPACE_KEYS.items()})
+
+    for ptr, key in SPACE_KEYS.items():
+        idx = pool['spaces'].get(key)
+        if (idx is None):
+            continue
+        propnames[_slot_propname(idx)] = ptr
+
+        #the space holding this slot is gone, another one took its key. Unknown owners are adopted, after a file load
+        owner = pool['owners'].get(key)
+        if (owner != ptr):
+            pool['owners'][key] = ptr
+            if (owner is not None):
+                newowners.append(spaces[ptr][2])
+
+    SPACE_INDEX['generation'] = LAYOUT_GENERATION
+    SPACE_INDEX['fingerprint'] = _layout_fingerprint(context)
+    SPACE_INDEX['spaces'] = spaces
+    SPACE_INDEX['propnames'] = propnames
+
+    for s in newowners:
+        _init_slot_value(s)
+
+    return SPACE_INDEX
+
+@_delegated
+def _space_key(space) -> tuple:
+    """a stable identity for a displayed properties space: (screen name, area index, space index). 
+    Unlike its memory adress, it survives file reloads. None if the space is not indexed yet, see '_discover_spaces'"""
+    return SPACE_KEYS.get(space.as_pointer())
+
+# Custom property of the screens, storing the custom tab selected per "areaindex:spaceindex"
+PERSIST_PROPNAME = 'TabCustv1_tabs'
+
+def _persist_tab(screen, key:tuple, uniqueid:str):
+    """store the custom tab selected in a space in its screen, or forget it if None"""
+
+    if (key is None):
+        return None
+
+    tabs = screen.get(PERSIST_PROPNAME)
+    spacekey = f"{key[1]}:{key[2]}"
+
+    if (uniqueid is None):
+        if (tabs is not None) and (spacekey in tabs):
+            del tabs[spacekey]
+        return None
+
+    if (tabs is None):
+        screen[PERSIST_PROPNAME] = {}
+        tabs = screen[PERSIST_PROPNAME]
+    if (tabs.get(spacekey) != uniqueid):
+        tabs[spacekey] = uniqueid
+
+    return None
+
+def _restorefunc():
+    """one shot timer, after a file reload, sync the slots of the known editors again, 
+    and select the custom tabs users had open"""
+
+    context = bpy.context
+    wm = context.window_manager
+
+    for ptr, (w, a, space) in list(_get_space_index(context, refresh=True)['spaces'].items()):
+
+        #the slot survived the reload, but the window_manager might be new
+        if not _reg_enumproperty_for_space(space):
+            _init_slot_value(space)
+
+        tabs = w.screen.get(PERSIST_PROPNAME)
+        key = SPACE_KEYS.get(ptr)
+        if (not tabs) or (key is None):
+            continue
+
+        uniqueid = tabs.get(f"{key[1]}:{key[2]}")
+        propname = get_customtab_propname(space)
+        if (uniqueid is None) or (propname is None) or (_get_tab(uniqueid) is None):
+            continue
+
+        region = next((r for r in a.regions if (r.type=='NAVIGATION_BAR')), None)
+        with context.temp_override(window=w, area=a, region=region):
+            try:
+                setattr(wm, propname, uniqueid)
+            except Exception as e:
+                #the tab might be hidden by its poll in this context
+                _dprint(f"Restore: couldn't select '{uniqueid}' in {key}\n{e}")
+
+        a.tag_redraw()
+        continue
+
+    return None
+
+def _clear_space_index():
+    """forget our index, the spaces it holds might not exist anymore"""
+
+    SPACE_KEYS.clear()
+    SPACE_INDEX['generation'] = None
+    SPACE_INDEX['fingerprint'] = None
+    SPACE_INDEX['spaces'] = {}
+    SPACE_INDEX['propnames'] = {}
+
+    return None
+
+def _layout_fingerprint(context) -> tuple:
+    """a cheap summary of the screen layouts, changes whenever an editor could have been added"""
+
+    return tuple(
+        (w.as_pointer(), w.screen.as_pointer(), tuple(a.type for a in w.screen.areas))
+        for w in context.window_manager.windows
+        )
+
+def _discover_spaces(context=None):
+    """register the enum property of any new properties editor, and redraw them"""
+
+    for w, a, s in _get_space_index(context)['spaces'].values():
+        if _reg_enumproperty_for_space(s):
+            a.tag_redraw()
+
+    return None
+
+# Reasons our background work is suspended for, in ('PLAYBACK','RENDER','BAKE',). 
+# Playback and long jobs are when frame rate matters the most, the layout won't change much meanwhile.
+SUSPENDED = set()
+
+@_delegated
+def _set_suspended(reason:str, status:bool):
+    """suspend or resume our background work for the given reason. Once all reasons are gone, we reconcile once"""
+
+    if (status):
+        SUSPENDED.add(reason)
+        return None
+
+    if (reason not in SUSPENDED):
+        return None
+
+    SUSPENDED.discard(reason)
+    if (not SUSPENDED):
+        _dprint("Suspension: resuming, requesting a reconciliation")
+        if not bpy.app.timers.is_registered(_reconcilefunc):
+            bpy.app.timers.register(_reconcilefunc, first_interval=0.0)
+
+    return None
+
+def _poll_suspension(context) -> bool:
+    """check if we are playing animations, rendering or baking, in case a handler was missed. Return True if suspended"""
+
+    _set_suspended('PLAYBACK', any(w.screen.is_animation_playing for w in context.window_manager.windows))
+    _set_suspended('RENDER', bpy.app.is_job_running('RENDER'))
+    _set_suspended('BAKE', bpy.app.is_job_running('OBJECT_BAKE'))
+
+    return bool(SUSPENDED)
+
+@_instrumented('reconciliation')
+def _reconcilefunc():
+    """one shot timer, catch up with what we skipped while suspended"""
+
+    global LAYOUT_FINGERPRINT
+
+    # the timer will walk the layout again, and reclaim what was closed meanwhile
+    LAYOUT_FINGERPRINT = None
+    ACTIVETAB_CACHE.clear()
+    _discoveryfunc()
+
+    return None
+
+def _suspension_handler(reason:str, status:bool):
+    """create a persistent handler suspending or resuming our work for the given reason"""
+
+    @bpy.app.handlers.persistent
+    def handler(*args):
+        _set_suspended(reason, status)
+        return None
+
+    handler.__name__ = f"_handlerfct_TabCustv1_{reason.lower()}_{'pre' if status else 'post'}"
+
+    return handler
+
+# (bpy.app.handlers list name, handler). Some of these lists might not exist depending on blender version
+SUSPENSION_HANDLERS = (
+    ('animation_playback_pre', _suspension_handler('PLAYBACK', True)),
+    ('animation_playback_post', _suspension_handler('PLAYBACK', False)),
+    ('render_init', _suspension_handler('RENDER', True)),
+    ('render_complete', _suspension_handler('RENDER', False)),
+    ('render_cancel', _suspension_handler('RENDER', False)),
+    ('object_bake_pre', _suspension_handler('BAKE', True)),
+    ('object_bake_complete', _suspension_handler('BAKE', False)),
+    ('object_bake_cancel', _suspension_handler('BAKE', False)),
+    )
+
+@_delegated
+@_instrumented('timer')
+def _timerfunc():
+    """function executed reccurently. In here we register any new Ui property user might need!
+    Only does real work when the screen layout changed, otherwise it will progressively slow down"""
+    #Warning, context access from a timer is exessively frustrating
+
+    global TIMER_INTERVAL, LAYOUT_FINGERPRINT, LAYOUT_GENERATION
+
+    #some add-ons might have registered new tool panels since, cheap check
+    if (TOOL_IMPOSTORS and _has_new_panels()):
+        _patch_tool_panels()
+        #the panels might come from an older module instance
+        _serve_legacy_instances()
+
+    context = bpy.context
+
+    #playing animations, rendering or baking? our work can wait
+    if _poll_suspension(context):
+        return TIMER_INTERVAL_MAX
+
+    fingerprint = _layout_fingerprint(context)
+
+    #nothing changed? we can wait longer next time
+    if (fingerprint == LAYOUT_FINGERPRINT):
+        TIMER_INTERVAL = min(TIMER_INTERVAL*2, TIMER_INTERVAL_MAX)
+        return TIMER_INTERVAL
+
+    LAYOUT_FINGERPRINT = fingerprint
+    LAYOUT_GENERATION += 1
+    _discover_spaces(context)
+
+    #some editors might have been closed
+    _reclaim_enumproperties()
+
+    TIMER_INTERVAL = TIMER_INTERVAL_MIN
+    return TIMER_INTERVAL
+
+@_instrumented('discovery')
+def _discoveryfunc():
+    """one shot timer, requested when an unknown editor is drawn"""
+
+    global TIMER_INTERVAL, LAYOUT_GENERATION
+
+    LAYOUT_GENERATION += 1
+    _discover_spaces()
+
+    #the user is likely editing his layout
+    TIMER_INTERVAL = TIMER_INTERVAL_MIN
+
+    return None
+
+@_delegated
+def _request_discovery():
+    """ask for a discovery as soon as possible, we can't register properties while drawing"""
+
+    if not bpy.app.timers.is_registered(_discoveryfunc):
+        bpy.app.timers.register(_discoveryfunc, first_interval=0.0)
+
+    return None
+
+def _reg_timers(regstatus:bool):
+    """register our timers"""
+
+    match regstatus:
+
+        case True:
+            
+            #many instance of this code might be run across many addons. Only one timer need to be active, ours.
+            #instances predating 'TabCustv1_timerfct' didn't record their timer, we find it in their module
+            timers = [m._timerfunc for m in _module_instances() if (m is not _THIS)]
+            timers.append(getattr(bpy.types.WindowManager,'TabCustv1_timerfct',None))
+            for fct in timers:
+                if (fct is not None) and (fct is not _timerfunc) and bpy.app.timers.is_registered(fct):
+                    bpy.app.timers.unregister(fct)
+
+            #older module instances only check this flag
+            wm = bpy.context.window_manager
+            if not hasattr(wm,'TabCustv1_timerflag'):
+                bpy.types.WindowManager.TabCustv1_timerflag = bpy.props.BoolProperty(
+                    name="TabCust Timer Registered",
+                    description="No need to register more timers",
+                    default=True,
+                    )
+
+            bpy.types.WindowManager.TabCustv1_timerfct = _timerfunc
+            if not bpy.app.timers.is_registered(_timerfunc):
+                bpy.app.timers.register(_timerfunc, persistent=True)
+        
+        case False:
+            if bpy.app.timers.is_registered(_timerfunc):
+                bpy.app.timers.unregister(_timerfunc)
+
+    return None
+
+# What the depsgraph handler saw last time it did some work, and how often it could skip it
+HANDLER_GATE = None
+HANDLER_GATE_STATS = {'calls':0, 'skipped':0,}
+
+@bpy.app.handlers.persistent
+@_delegated
+@_instrumented('depsgraph_handler')
+def _handlerfct_TabCustv1_post(_): #needed an unique fct name
+    """update on depsgraph change. 
+    This runs very often (playback, transforms, sculpt..), we only work if a new editor might have appeared"""
+
+    global HANDLER_GATE
 
-def _timerfunc():
-    """function executed reccurently. In here we register any new Ui property user might need!"""
-    #Warning, context access from a timer is exessively frustrating
+    HANDLER_GATE_STATS['calls'] += 1
+
+    # the active object or mode might have changed, our enums items too
+    ACTIVETAB_CACHE.clear()
 
+    # we are playing animations, rendering or baking, we'll reconcile afterwards
+    if (SUSPENDED):
+        HANDLER_GATE_STATS['skipped'] += 1
+        return None
+
+    # the layout generation covers area edits, the screens cover new windows and workspace switches
     context = bpy.context
-    for s in _all_properties_spaces(context):
-        _reg_enumproperty_for_space(s)
+    gate = (LAYOUT_GENERATION, tuple(w.screen.as_pointer() for w in context.window_manager.windows))
+    if (gate == HANDLER_GATE):
+        HANDLER_GATE_STATS['skipped'] += 1
+        return None
 
-    return 0.4
+    # a new generation means our timer or a discovery already walked the new layout, 
+    # only new windows or workspace switches are left for us to catch
+    screens_changed = (HANDLER_GATE is None) or (HANDLER_GATE[1] != gate[1])
+    HANDLER_GATE = gate
+    if (not screens_changed):
+        HANDLER_GATE_STATS['skipped'] += 1
+        return None
 
-def _reg_timers(regstatus:bool):
-    """register our timers"""
+    _get_space_index(context, refresh=True)
+    _discover_spaces(context)
+    _dprint(f"DepsgraphHandler: gate opened, {HANDLER_GATE_STATS}")
 
-    match regstatus:
+    return None
 
-        case True:
-            
-            #many instance of this code might be run across many addons. Only one timer need to be active
-            wm = bpy.context.window_manager
-            if hasattr(wm,'TabCustv1_timerflag'):
-                return None
+def _clear_caches():
+    """clear our context caches, spaces memory adresses are not valid anymore after loading a file"""
 
-            bpy.types.WindowManager.TabCustv1_timerflag = bpy.props.BoolProperty(
-                name="TabCust Timer Registered",
-                description="No need to register more timers",
-                default=True,
-                )
-            bpy.app.timers.register(_timerfunc, persistent=True)
-        
-        case False:
-            bpy.app.timers.unregister(_timerfunc)
+    global LAYOUT_FINGERPRINT, LAYOUT_GENERATION, TIMER_INTERVAL
+
+    _clear_space_index()
+    ENUMITEMS_CACHE.clear()
+    ENUMITEMS_SHARED.clear()
+    NATIVE_TABS_CACHE.clear()
+    POLL_CACHE.clear()
+    ACTIVETAB_CACHE.clear()
+
+    LAYOUT_FINGERPRINT = None
+    LAYOUT_GENERATION += 1
+    TIMER_INTERVAL = TIMER_INTERVAL_MIN
 
     return None
 
 @bpy.app.handlers.persistent
-def _handlerfct_TabCustv1_post(_): #needed an unique fct name
-    """update on depsgraph change"""
+@_delegated
+def _handlerfct_TabCustv1_loadpre(_): #needed an unique fct name
+    """Handler function before user is loading a file, the spaces we know of are about to be freed"""
 
-    context = bpy.context
-    for s in _all_properties_spaces(context):
-        _reg_enumproperty_for_space(s)
+    _clear_space_index()
+
+    #the adresses of the slots owners are about to be freed, slots are matched by their keys after the load
+    _get_slotpool()['owners'].clear()
+
+    #the providers of all module instances might be working on data about to be freed
+    for m in _engines():
+        if hasattr(m,'_reset_providers'):
+            m._reset_providers()
 
     return None
 
 @bpy.app.handlers.persistent
+@_delegated
 def _handlerfct_TabCustv1_load(_): #needed an unique fct name
     """Handler function when user is loading a file"""
 
+    _clear_caches()
+
+    #all spaces have new memory adresses, but their stable keys might still be valid
+    _reclaim_enumproperties()
+
+    #select the custom tabs users had open again
+    if not bpy.app.timers.is_registered(_restorefunc):
+        bpy.app.timers.register(_restorefunc, first_interval=0.0)
+
     return _reg_timers(True)
 
 def _reg_handlers(regstatus:bool):
-    """register handlers by name to avoid doubles"""
+    """register our handlers. They are found by name, other module instances might have registered theirs: we replace them"""
 
-    match regstatus:
+    handlers = (
+        ('depsgraph_update_post', _handlerfct_TabCustv1_post),
+        ('load_post', _handlerfct_TabCustv1_load),
+        ('load_pre', _handlerfct_TabCustv1_loadpre),
+        ) + SUSPENSION_HANDLERS
 
-        case True:
-            handler_names = [h.__name__ for h in _all_handlers()]
-            if ('_handlerfct_TabCustv1_post' not in handler_names):
-                bpy.app.handlers.depsgraph_update_post.append(_handlerfct_TabCustv1_post)
-            if ('_handlerfct_TabCustv1_load' not in handler_names):
-                bpy.app.handlers.load_post.append(_handlerfct_TabCustv1_load)
-        
-        case False:
-            for h in _all_handlers():
-                if(h.__name__=='_handlerfct_TabCustv1_post'):
-                    bpy.app.handlers.depsgraph_update_post.remove(h)
-                if(h.__name__=='_handlerfct_TabCustv1_load'):
-                    bpy.app.handlers.load_post.remove(h)
+    for listname, h in handlers:
+
+        hlist = getattr(bpy.app.handlers, listname, None)
+        if (hlist is None):
+            continue
+
+        for o in [o for o in hlist if (getattr(o,'__name__','')==h.__name__)]:
+            hlist.remove(o)
+
+        if (regstatus):
+            hlist.append(h)
+
+        continue
 
-    return None 
+    return None
 
 # ooooo                                                     .   
 # `888'                                                   .o8   
@@ -610,205 +2110,275 @@ def _reg_handlers(regstatus:bool):
 ORIGINAL_CLASSES = []
 PATCHED_CLASSES = []
 
-def _reg_tool_impostors(regstatus:bool):
-    """monkey patching the draw/poll functions of the tool Properties category.
-    we chose this section as it is mostly deserted, and unaffected by context"""
+TOOL_CATEGORY = ('VIEW_3D','UI','Tool',)
+TOOL_IMPOSTORS = False #are we patching the tool panels? new ones are caught by the timer
+PANELS_INDEXED = weakref.WeakSet() #add-ons can be disabled, we never keep their classes alive
+PANELS_BY_CATEGORY = {} #(bl_space_type, bl_region_type, bl_category) -> weak references of parent panels
+PANELS_CHILDREN = {}    #bl_parent_id -> weak references of children panels
+PANELS_PENDING = weakref.WeakSet() #tool panels we indexed before they were registered
+
+@_delegated
+@_instrumented('header_draw')
+def _draw_customtab_header(layout, context, tabval):
+    """draw the header and custom layout of a custom tab, in place of the active tool header"""
+
+    #find back icon and name
+    tab = _get_tab(tabval) or {}
+    tabname = tab.get('name')
+    tabicon = tab.get('icon')
+    tabheader = tab.get('header')
+    tabdraw = tab.get('draw')
+    tabgroup = tab.get('group')
+
+    #draw a custom header function?
+    if (tabheader):
+        _cost_call(tabval, 'header', tabheader, layout, context)
+
+    else:
+        #else we draw a little simple drawing
+        row = layout.row()
+        row_left = row.row(align=True)
+        row_left.alignment = 'LEFT'
+        row_right = row.row(align=True)
+        row_right.alignment = 'RIGHT'
+
+        #draw a little breadcrumb if the panel is in group that draws a breadcrumb
+        match tabgroup:
+            case 'SCENE':
+                row_left.label(text='Scene', icon='SCENE_DATA')
+                row_left.label(text='', icon='RIGHTARROW')
+            case 'COLLECTION':
+                row_left.label(text=context.collection.name if context.collection else 'Collection', icon='COLLECTION')
+                row_left.label(text='', icon='RIGHTARROW')
+            case 'OBJECT':
+                row_left.label(text=context.active_object.name if context.active_object else 'Object', icon='OBJECT_DATA')
+                row_left.label(text='', icon='RIGHTARROW')
+
+        #draw the icon
+        if (tabicon):
+            match tabicon:
+                case str(): row_left.label(text='', icon=tabicon,)
+                case int(): row_left.label(text='', icon_value=tabicon,)
+
+        if (tabname):
+            row_left.label(text=tabname)
+
+        # TODO custom behavior for pin perhaps? Native pin was not designed for Tool context..
+        # pin_icon = 'PINNED' if bool(space.pin_id) else 'UNPINNED'
+        # row_right.operator("buttons.toggle_pin", text="", icon=pin_icon, emboss=False,)
+
+    #separate header from content
+    layout.separator(factor=0.5)
+
+    #draw a custom layout?
+    if (tabdraw):
+        _cost_call(tabval, 'draw', tabdraw, layout, context)
+
+    return None
+
+def _tool_impostor(ocl):
+    """create the patched copy of a native tool panel"""
+
+    class Patched(ocl):
+        """exact copy of original Panel class, but with tweaked poll behavior"""
+        __name__ = ocl.__name__
+        bl_idname = ocl.__name__
+
+        CustTabIsPatched = True
+        CustTabIsHeader = ocl.__name__=='VIEW3D_PT_active_tool_duplicate'
+        if CustTabIsHeader:
+            bl_order = 0
+
+        original_draw = ocl.draw
+        original_poll = ocl.poll if hasattr(ocl,'poll') else None
+
+        def draw(self, context, *args, **kwargs):
+
+            layout = self.layout
+            space = context.space_data
+
+            #header of the editor. If tab is custom tool, we draw a custom header
+            if self.CustTabIsHeader:
+                if (space.type=='PROPERTIES' and space.context=='TOOL'):
+                    _draw_costs_header(layout)
+                    tabval = _get_active_tab(space)
+                    if (tabval!='TOOL'):
+                        return _draw_customtab_header(layout, context, tabval)
+
+            #debug data?
+            if (DEBUG_MODE):
+                layout.box().label(text="I'm Patched!", icon="GHOST_ENABLED")
+            return self.original_draw(context, *args, **kwargs)
 
-    childrenreload = False
-    classes_to_patch = []
-    classes_children = []
+        @classmethod
+        def poll(cls, context, *args, **kwargs):
+            """matched poll function, custom behavior in properties now, need to look at window_manager.CustomTab value"""
+
+            space = context.space_data
+
+            #execute native poll function
+            original_cond = True
+            if cls.original_poll:
+                original_cond = cls.original_poll(context, *args, **kwargs)
+
+            #specific poll condictions if in TOOL context
+            added_cond = True
+            if (space.type=='PROPERTIES' and space.context=='TOOL'):
+                tabval = _get_active_tab(space)
+
+                #for headers panel, we always draw
+                if (cls.CustTabIsHeader):
+                      added_cond = True
+                else: added_cond = tabval in {'TOOL',None}
+
+            return original_cond and added_cond
+
+    return Patched
+
+def _is_registered(cls):
+    return getattr(bpy.types, getattr(cls,'bl_idname','') or cls.__name__, None) is cls
+
+def _alive(refs) -> list:
+    """the classes of a list of weak references that still exist"""
+    return [cls for cls in (r() for r in refs) if (cls is not None)]
+
+def _has_new_panels() -> bool:
+    """check if some Panel classes were never indexed, or if some tool panels we indexed got registered since. 
+    Classes come and go, so we don't compare with a stored count. 
+    The classes we indexed that are freed leave both our weak index and the subclasses, any difference is a new class"""
+
+    if (len(bpy.types.Panel.__subclasses__()) != len(PANELS_INDEXED)):
+        return True
+
+    return any(_is_registered(panel) for panel in PANELS_PENDING)
+
+def _index_panels():
+    """index the Panel classes we never saw before. Parents by category, children by parent idname. 
+    The classes that were freed since are forgotten"""
+
+    for index in (PANELS_BY_CATEGORY, PANELS_CHILDREN):
+        for k, refs in list(index.items()):
+            refs[:] = [r for r in refs if (r() is not None)]
+            if (not refs):
+                del index[k]
 
-    #gather the classes we need to patch. All type UI TOOL for View3D..
     for panel in bpy.types.Panel.__subclasses__():
 
+        if (panel in PANELS_INDEXED):
+            continue
+        PANELS_INDEXED.add(panel)
+
         #user classes we skip. separate function for that.
         if hasattr(panel,'CustTabUniqueID'):
             continue
 
-        #ensure the attributes are correct
-        if not (hasattr(panel,'bl_region_type') and hasattr(panel,'bl_category') and hasattr(panel,'bl_space_type') \
-                and (panel.bl_region_type=='UI' and panel.bl_category=="Tool" and panel.bl_space_type=='VIEW_3D')):
+        parentid = getattr(panel,'bl_parent_id','')
+        if (parentid):
+            PANELS_CHILDREN.setdefault(parentid, []).append(weakref.ref(panel))
             continue
-        
-        #store children separately, 
-        #we only patch the parents then reload the children
-        if hasattr(panel,'bl_parent_id'):
-              classes_children.append(panel)
-              continue
 
-        classes_to_patch.append(panel)
+        category = (getattr(panel,'bl_space_type',None), getattr(panel,'bl_region_type',None), getattr(panel,'bl_category',None),)
+        PANELS_BY_CATEGORY.setdefault(category, []).append(weakref.ref(panel))
         continue
 
-    #proceed to the registration of patches
-    match regstatus:
+    return None
 
-        case True:
-            
-            #NOTE for registration, we monkeypatch by reg/unreg the class entirely
-            # because we use the same name as blender class, it will effectively replace it
+def _reload_children(idname:str):
+    """when we reg/unreg a panel, we need to refresh its children, and their own children"""
 
-            for ocl in classes_to_patch:
+    for ocl in _alive(PANELS_CHILDREN.get(idname, ())):
+        if not _is_registered(ocl):
+            continue
+        _dprint('reloading children:',ocl)
+        bpy.utils.unregister_class(ocl)
+        bpy.utils.register_class(ocl)
+        _reload_children(getattr(ocl,'bl_idname','') or ocl.__name__)
 
-                #we register only non-registerepatchedd classes
-                if hasattr(ocl, 'CustTabIsPatched'):
-                    continue
+    return None
 
-                class Patched(ocl):
-                    """exact copy of original Panel class, but with tweaked poll behavior"""
-                    __name__ = ocl.__name__
-                    bl_idname = ocl.__name__
-
-                    CustTabIsPatched = True
-                    CustTabIsHeader = ocl.__name__=='VIEW3D_PT_active_tool_duplicate'
-                    if CustTabIsHeader:
-                        bl_order = 0
-
-                    original_draw = ocl.draw
-                    original_poll = ocl.poll if hasattr(ocl,'poll') else None
-
-                    def draw(self, context, *args, **kwargs):
-
-                        layout = self.layout
-                        space = context.space_data
-
-                        #header of the editor. If tab is custom tool, we draw a custom header
-                        if self.CustTabIsHeader:
-                            if (space.type=='PROPERTIES' and space.context=='TOOL'):
-                                tabval = get_customtab_value(space)
-                                if (tabval!='TOOL'):
-
-                                    #find back icon and name
-                                    tabname = _get_from_registry(tabval,'name')
-                                    tabicon = _get_from_registry(tabval,'icon')
-                                    tabheader = _get_from_registry(tabval,'header')
-                                    tabdraw = _get_from_registry(tabval,'draw')
-                                    tabgroup = _get_from_registry(tabval,'group')
-
-                                    #draw a custom header function?
-                                    if (tabheader):
-                                        tabheader(layout, context)
-
-                                    else:
-                                        #else we draw a little simple drawing
-                                        row = layout.row()
-                                        row_left = row.row(align=True)
-                                        row_left.alignment = 'LEFT'
-                                        row_right = row.row(align=True)
-                                        row_right.alignment = 'RIGHT'
-
-                                        #draw a little breadcrumb if the panel is in group that draws a breadcrumb
-                                        match tabgroup:
-                                            case 'SCENE':
-                                                row_left.label(text='Scene', icon='SCENE_DATA')
-                                                row_left.label(text='', icon='RIGHTARROW')
-                                            case 'COLLECTION':
-                                                row_left.label(text=context.collection.name if context.collection else 'Collection', icon='COLLECTION')
-                                                row_left.label(text='', icon='RIGHTARROW')
-                                            case 'OBJECT':
-                                                row_left.label(text=context.active_object.name if context.active_object else 'Object', icon='OBJECT_DATA')
-                                                row_left.label(text='', icon='RIGHTARROW')
-
-                                        #draw the icon
-                                        if (tabicon):
-                                            match tabicon:
-                                                case str(): row_left.label(text='', icon=tabicon,)
-                                                case int(): row_left.label(text='', icon_value=tabicon,)
-
-                                        if (tabname):
-                                            row_left.label(text=tabname)
-
-                                        # TODO custom behavior for pin perhaps? Native pin was not designed for Tool context..
-                                        # pin_icon = 'PINNED' if bool(space.pin_id) else 'UNPINNED'
-                                        # row_right.operator("buttons.toggle_pin", text="", icon=pin_icon, emboss=False,)
-
-                                    #separate header from content
-                                    layout.separator(factor=0.5)
-
-                                    #draw a custom layout?
-                                    if (tabdraw):
-                                        tabdraw(layout, context)
-
-                                    return None
-
-                        #debug data?
-                        if (DEBUG_MODE):
-                            layout.box().label(text="I'm Patched!", icon="GHOST_ENABLED")
-                        return self.original_draw(context, *args, **kwargs)
-
-                    @classmethod
-                    def poll(cls, context, *args, **kwargs):
-                        """matched poll function, custom behavior in properties now, need to look at window_manager.CustomTab value"""
-
-                        space = context.space_data
-
-                        #execute native poll function
-                        original_cond = True
-                        if cls.original_poll:
-                            original_cond = cls.original_poll(context, *args, **kwargs)
-
-                        #specific poll condictions if in TOOL context
-                        added_cond = True
-                        if (space.type=='PROPERTIES' and space.context=='TOOL'):
-                            tabval = get_customtab_value(space)
-
-                            #for headers panel, we always draw
-                            if (cls.CustTabIsHeader):
-                                  added_cond = True
-                            else: added_cond = tabval in {'TOOL',None}
-
-                        return original_cond and added_cond
-
-                #store classes in global for unreg later.
-                ORIGINAL_CLASSES.append(ocl)
-                PATCHED_CLASSES.append(Patched)
-
-                #proceed to unregister the original, and register the patched one
-                _dprint('unload original and loading patch:',ocl)
-                bpy.utils.unregister_class(ocl)
-                bpy.utils.register_class(Patched)
-                childrenreload = True
+@_instrumented('tool_patching')
+def _patch_tool_panels():
+    """patch the registered tool panels we did not patch yet. Only the children of the newly patched panels are reloaded"""
 
-                continue
+    _index_panels()
 
-        case False:
+    newly = []
+    for ocl in _alive(PANELS_BY_CATEGORY.get(TOOL_CATEGORY, ())):
 
-            for pcl in PATCHED_CLASSES:
+        #we register only non-patched, registered classes
+        if (ocl in ORIGINAL_CLASSES):
+            continue
 
-                #we unregister patch only!
-                if not hasattr(pcl, 'CustTabIsPatched'):
-                    continue
+        #older module instances might have patched it with their own polls, we replace their patch
+        current = getattr(bpy.types, getattr(ocl,'bl_idname','') or ocl.__name__, None)
+        if (current is not ocl) and not (getattr(current,'CustTabIsPatched',False) and issubclass(current, ocl)):
+            #not registered yet, we'll check it again on our next ticks
+            PANELS_PENDING.add(ocl)
+            continue
+        PANELS_PENDING.discard(ocl)
+
+        #the class might replace one we patched before
+        for i, pcl in reversed(list(enumerate(PATCHED_CLASSES))):
+            if (pcl.bl_idname == ocl.__name__):
+                del PATCHED_CLASSES[i], ORIGINAL_CLASSES[i]
+
+        Patched = _tool_impostor(ocl)
+
+        #store classes in global for unreg later.
+        ORIGINAL_CLASSES.append(ocl)
+        PATCHED_CLASSES.append(Patched)
+
+        #proceed to unregister the original, and register the patched one
+        #NOTE we monkeypatch by reg/unreg the class entirely
+        # because we use the same name as blender class, it will effectively replace it
+        _dprint('unload original and loading patch:',ocl)
+        bpy.utils.unregister_class(current)
+        bpy.utils.register_class(Patched)
+        newly.append(ocl.__name__)
+
+        continue
+
+    for idname in newly:
+        _reload_children(idname)
+
+    return None
+
+def _reg_tool_impostors(regstatus:bool):
+    """monkey patching the draw/poll functions of the tool Properties category.
+    we chose this section as it is mostly deserted, and unaffected by context"""
+
+    global TOOL_IMPOSTORS
+
+    match regstatus:
+
+        case True:
+            TOOL_IMPOSTORS = True
+            _patch_tool_panels()
+
+        case False:
+            TOOL_IMPOSTORS = False
 
-                #unregister our patches
-                _dprint('unloading patch:',pcl)
-                bpy.utils.unregister_class(pcl)
+            for ocl, pcl in zip(ORIGINAL_CLASSES, PATCHED_CLASSES):
 
-                #and register the original class instead
-                for ocl in ORIGINAL_CLASSES:
-                    if (ocl.__name__ == pcl.bl_idname):
-                        _dprint('loading original:',pcl)
-                        bpy.utils.register_class(ocl)
+                #unregister our patches, and register the original class instead
+                if _is_registered(pcl):
+                    _dprint('unloading patch:',pcl)
+                    bpy.utils.unregister_class(pcl)
+                    _dprint('loading original:',ocl)
+                    bpy.utils.register_class(ocl)
+                    _reload_children(ocl.__name__)
 
-                childrenreload = True
                 continue
 
             PATCHED_CLASSES.clear()
             ORIGINAL_CLASSES.clear()
 
-    #when we reg/unreg a panel, we need to refresh children.
-    if childrenreload:
-        for ocl in classes_children:
-            _dprint('reloading children:',ocl)
-            bpy.utils.unregister_class(ocl)
-            bpy.utils.register_class(ocl)
-
     return None
 
 USER_PANELS = []
 
-def _reg_userpanel(panel, uniqueid):
-    """Register bpy.types.Panel of a tab via this operator"""
-
-    global USER_PANELS
+def _check_userpanel(panel):
+    """ensure the given user panel can be registered as a tab panel"""
 
     #we work with panels only
     if not issubclass(panel, bpy.types.Panel):
@@ -820,6 +2390,16 @@ def _reg_userpanel(panel, uniqueid):
     if hasattr(panel, 'CustTabIsPatched'):
         raise Exception(f"CustomTab: It seems that you already have registered the Panel '{panel}'.")
 
+    return None
+
+@_instrumented('panel_registration')
+def _reg_userpanel(panel, uniqueid):
+    """Register bpy.types.Panel of a tab via this operator"""
+
+    global USER_PANELS
+
+    _check_userpanel(panel)
+
     class PatchPanel(panel):
         """exact copy of original Panel class, but with tweaked poll behavior"""
         __name__ = panel.__name__
@@ -848,19 +2428,169 @@ def _reg_userpanel(panel, uniqueid):
             #execute native poll function
             original_cond = True
             if cls.original_poll:
-                original_cond = cls.original_poll(context, *args, **kwargs)
+                original_cond = _cost_call(cls.CustTabUniqueID, 'panel_poll', cls.original_poll, context, *args, **kwargs)
 
             #specific poll condictions if in TOOL context
-            return original_cond and get_customtab_value(space) == cls.CustTabUniqueID
+            return original_cond and _get_active_tab(space) == cls.CustTabUniqueID
 
     bpy.utils.register_class(PatchPanel)
     USER_PANELS.append(PatchPanel)
 
     return None
 
+# Tabs appended with 'dispatch' don't register their panels. 
+# Instead, a single dispatcher panel resolves the active tab once, then polls and draws only the panels of this tab.
+DISPATCHER_IDNAME = 'TABCUSTV1_PT_dispatcher'
+
+class _DispatchedPanel:
+    """stand-in instance of a user panel drawn by the dispatcher, giving it a layout"""
+
+    def __init__(self, panel, layout):
+        self.layout = layout
+        self.panel = panel
+
+    def __getattr__(self, name):
+        attr = getattr(self.panel, name)
+        #methods of the user panel need to be bound to us
+        if isinstance(attr, types.FunctionType):
+            return types.MethodType(attr, self)
+        return attr
+
+@_delegated
+def _draw_dispatched(panel, children:dict, layout, context, uniqueid:str=None):
+    """draw a user panel and its children, as a layout panel of the dispatcher"""
+
+    if hasattr(panel,'poll') and (not _cost_call(uniqueid, 'panel_poll', panel.poll, context)):
+        return None
+
+    options = getattr(panel,'bl_options',set())
+
+    if ('HIDE_HEADER' in options):
+        body = layout
+    else:
+        header, body = layout.panel(panel.__name__, default_closed=('DEFAULT_CLOSED' in options),)
+        if hasattr(panel,'draw_header'):
+            panel.draw_header(_DispatchedPanel(panel, header), context)
+        if getattr(panel,'bl_label',''):
+            header.label(text=panel.bl_label)
+
+    #panel is closed
+    if (body is None):
+        return None
+
+    if hasattr(panel,'draw'):
+        panel.draw(_DispatchedPanel(panel, body), context)
+
+    for child in children.get(panel.__name__, ()):
+        _draw_dispatched(child, children, body, context, uniqueid)
+
+    return None
+
+def _reg_dispatcher():
+    """register the dispatcher panel, only once for all module instances"""
+
+    if hasattr(bpy.types, DISPATCHER_IDNAME):
+        return None
+
+    class TABCUSTV1_PT_dispatcher(bpy.types.Panel):
+        """route the drawing of the active tab panels, see 'dispatch' in 'append_tab'"""
+
+        bl_idname = DISPATCHER_IDNAME
+        bl_label = ""
+        bl_space_type = 'VIEW_3D'
+        bl_region_type = 'UI'
+        bl_category = 'Tool'
+        bl_options = {'HIDE_HEADER'}
+        bl_order = 1
+
+        CustTabUniqueID = None
+        CustTabIsPatched = True
+        CustTabIsHeader = False
+
+        @classmethod
+        def poll(cls, context):
+            space = context.space_data
+            if (space.type!='PROPERTIES') or (space.context!='TOOL'):
+                return False
+            tab = _get_tab(_get_active_tab(space))
+            return (tab is not None) and bool(tab.get('dispatch_panels'))
+
+        def draw(self, context):
+            tab = _get_tab(_get_active_tab(context.space_data))
+            if (tab is None):
+                return None
+            children = tab['dispatch_children']
+            for panel in tab['dispatch_panels']:
+                _draw_dispatched(panel, children, self.layout, context, tab['id'])
+            return None
+
+    bpy.utils.register_class(TABCUSTV1_PT_dispatcher)
+
+    return None
+
+def _ensure_tab_panels(uniqueid):
+    """register the panels of a tab appended with 'lazy_panels', if not done already.
+    The panels are registered by the module instance that appended the tab"""
+
+    tab = _get_tab(uniqueid)
+    if (tab is None):
+        return None
+
+    ensure = tab.get('ensure_panels')
+    if (ensure is not None):
+        ensure()
+
+    return None
+
+def _prewarmfunc():
+    """timer registering the lazy panels of one tab per execution, until there's none left"""
+
+    for tab in _get_registry():
+        if (type(tab) is dict) and tab.get('panels_pending'):
+            _ensure_tab_panels(tab['id'])
+            return 0.1
+
+    return None
+
+def prewarm_tab_panels(delay:float=5.0):
+    """Register the panels of tabs appended with `lazy_panels=True` in the background, one tab at a time, 
+    starting after the given delay in seconds. Use this if you'd rather not register them on first use"""
+
+    if (_is_headless()):
+        return None
+
+    if not bpy.app.timers.is_registered(_prewarmfunc):
+        bpy.app.timers.register(_prewarmfunc, first_interval=delay, persistent=True)
+
+    return None
+
 #Global, we'll store original blender draw function here
 NATIVE_NAVDRAW = None
 
+@_delegated
+def _draw_navigation_bar(layout, context):
+    """draw our tabs enum in place of the native navigation bar"""
+
+    wm = context.window_manager
+    space = context.space_data
+
+    layout.scale_x = 1.4
+    layout.scale_y = 1.4
+
+    data, propname = wm, get_customtab_propname(space)
+
+    #fallback if property not created yet, this is a new editor, we discover it right after this draw.
+    if (propname is None) or (not hasattr(wm,propname)):
+        #print("WARNING: CustomTabEnum for a space has not been created yet.\nFrom module instance: {__file__}")
+        data, propname = space, "context"
+        _request_discovery()
+
+    if (space.search_filter):
+          layout.prop_tabs_enum(data, propname, icon_only=True, data_highlight=space, property_highlight="tab_search_results",)
+    else: layout.prop_tabs_enum(data, propname, icon_only=True)
+
+    return None
+
 def _reg_nav_impostors(regstatus:bool):
     """Monkey patching a blender draw function"""
 
@@ -880,36 +2610,26 @@ def _reg_nav_impostors(regstatus:bool):
         case True:
 
             # many instance of this code might be run across many addons. 
-            # Only one draw impostor needed!
-            if hasattr(cls.draw,"TabCustImpostor"):
-                return None
+            # Only one draw impostor needed, ours!
+            native = cls.draw
+            if hasattr(native,"TabCustImpostor"):
+                if (native.__globals__ is globals()):
+                    return None
+
+                #the impostor of another module instance, we need the native draw it replaced
+                native = getattr(native,"TabCustNative",None) or native.__globals__.get('NATIVE_NAVDRAW')
+                if (native is None):
+                    print(f"WARNING: Couldn't find the native navigation bar draw.\nFrom module instance: {__file__}")
+                    return None
 
             def impostdraw(self, context):
                 """will monkey patch PROPERTIES_PT_navigation_bar.draw"""
-
-                wm = context.window_manager
-                space = context.space_data
-
-                layout = self.layout
-                layout.scale_x = 1.4
-                layout.scale_y = 1.4
-
-                data, propname = wm, get_customtab_propname(space)
-
-                #fallback if property not created yet
-                if not hasattr(wm,propname):
-                    #print("WARNING: CustomTabEnum for a space has not been created yet.\nFrom module instance: {__file__}")
-                    data, propname = space, "context"
-
-                if (space.search_filter):
-                      layout.prop_tabs_enum(data, propname, icon_only=True, data_highlight=space, property_highlight="tab_search_results",)
-                else: layout.prop_tabs_enum(data, propname, icon_only=True)
-
-                return None
+                return _draw_navigation_bar(self.layout, context)
 
             impostdraw.TabCustImpostor = True
+            impostdraw.TabCustNative = native
     
-            NATIVE_NAVDRAW = cls.draw
+            NATIVE_NAVDRAW = native
             cls.draw = impostdraw
 
         case False:
@@ -930,7 +2650,11 @@ def _reg_nav_impostors(regstatus:bool):
 #                        "Y88888P'  
 
 IDAPPENDED_TO_REGISTRY = []
-def append_tab(uniqueid:str="", icon:str|int="", name:str="", description:str="", poll=None, header=None, draw=None, panels:list=None, group:str='PLUGINS',):
+
+# The add-on hosting this module instance, recorded as the owner of the tabs it appends
+OWNER = __name__.rpartition('.')[0] or __name__
+
+def append_tab(uniqueid:str="", icon:str|int="", name:str="", description:str="", poll=None, poll_cache:set=None, header=None, draw=None, panels:list=None, lazy_panels:bool=False, dispatch:bool=False, group:str='PLUGINS',):
     """Register a new tab into the system.
     You must pass:
         `uniqueid` (string), 
@@ -938,42 +2662,158 @@ def append_tab(uniqueid:str="", icon:str|int="", name:str="", description:str=""
     with optional arguments:
         `group` (string) for grouping tabs together with spaces in between. Either choose an group exisiting in ('TOOLS','SCENE','COLLECTION','OBJECT','TEXTURE',) to spawn your tab near these items, or create your new group. If not provided, the tab will be appended to 'PLUGINS'.
         `panels` (list of Panels, children of bpy.types.Panel)
+        `lazy_panels` (bool) if True, your panels will only be registered the first time your tab is opened, speeding up blender startup. 
+            See `prewarm_tab_panels()` if you'd like to register them in the background instead.
+        `dispatch` (bool) if True, your panels are not registered at all. A single dispatcher panel draws them, as layout panels, 
+            only when your tab is active. Much cheaper if you have a lot of panels. Your panels can't rely on `bl_space_type` ect.. then.
         `name` (string) for the tab's display name
         `description` (string) for hover information, 
         `poll` (function) that takes `context` as an argument and returns a Boolean,
+        `poll_cache` (set of strings) opt-in caching of your poll result, shared by all editors of a window. Pass what your poll depends on,
+            the result is re-evaluated only when these change. Choose in ('ACTIVE_OBJECT','MODE','SELECTION','SCENE','FRAME',).
         `header` (function) that takes `layout` and `context` as arguments, for drawing a custom header.
         `draw` (function) that takes `layout` and `context` as arguments, for drawing a custom layout (use this instead of relying on 'panels').
     """
 
+    append_tabs(({
+        'uniqueid':uniqueid,
+        'icon':icon,
+        'name':name,
+        'description':description,
+        'poll':poll,
+        'poll_cache':poll_cache,
+        'header':header,
+        'draw':draw,
+        'panels':panels,
+        'lazy_panels':lazy_panels,
+        'dispatch':dispatch,
+        'group':group,
+        },))
+
+    return None
+
+def append_tabs(tabs:list):
+    """Register many tabs at once, much faster than calling `append_tab()` in a loop.
+    Pass a list of dictionaries, each containing the arguments of `append_tab()`. 
+    All tabs are validated before any of them is registered, then committed to the registry in one go."""
+
     global IDAPPENDED_TO_REGISTRY
 
+    records, regpanels, batchids = [], [], set()
+
+    # validate everything first, we don't want to leave a half registered batch behind
+    for kwargs in tabs:
+        record, panels = _build_tab_record(**kwargs)
+        uniqueid = record['id']
+        if (uniqueid in batchids) or (_get_tab(uniqueid) is not None):
+            print(f"WARNING: The uniqueid '{uniqueid}' is taken by another user. Impossible to register the custom tab.\nFrom module instance: {__file__}")
+            continue
+        batchids.add(uniqueid)
+        records.append(record)
+        regpanels.extend((p, uniqueid) for p in panels)
+
+    if (not records):
+        return None
+
+    # one registry commit, one version bump, one ordering plan
+    _extend_registry(records)
+    IDAPPENDED_TO_REGISTRY.extend(r['id'] for r in records)
+
+    if any(r['dispatch_panels'] for r in records) and not _is_headless():
+        _reg_dispatcher()
+
+    # register the panels ourselves, all together
+    for panel, uniqueid in regpanels:
+        _reg_userpanel(panel, uniqueid)
+
+    # let the editors know about our new tabs
+    _request_invalidate()
+
+    return None
+
+def _build_tab_record(uniqueid:str="", icon:str|int="", name:str="", description:str="", poll=None, poll_cache:set=None, header=None, draw=None, panels:list=None, lazy_panels:bool=False, dispatch:bool=False, group:str='PLUGINS',) -> tuple:
+    """check the arguments of a new tab and build its registry record.
+    return the record, and the panels to register right away"""
+
     if not (uniqueid and icon):
         raise Exception("Please make sure to at least pass a uniqueid string and an icon value.")
     
     if (uniqueid in NATIVE_IDS):
         raise Exception(f"The uniqueid '{uniqueid}' is taken by blender already.")
-    
-    if (uniqueid in _existing_registry_ids()):
-        print(f"WARNING: The uniqueid '{uniqueid}' is taken by another user. Impossible to register the custom tab.\nFrom module instance: {__file__}")
-        return None
 
-    _append_registry({
+    if (poll_cache):
+        if (poll is None):
+            raise Exception(f"Tab '{uniqueid}': 'poll_cache' is useless without a 'poll' function.")
+        for k in poll_cache:
+            if (k not in POLL_CACHE_KEYS):
+                raise Exception(f"Tab '{uniqueid}': Unknown poll_cache key '{k}'. Choose in {tuple(POLL_CACHE_KEYS.keys())}.")
+
+    for panel in (panels or ()):
+        _check_userpanel(panel)
+
+    # dispatched panels are drawn by our dispatcher panel, not registered
+    dispatch_panels, dispatch_children = None, None
+    if (panels and dispatch):
+        dispatch_panels = tuple(p for p in panels if not getattr(p,'bl_parent_id',''))
+        dispatch_children = {}
+        for p in panels:
+            if getattr(p,'bl_parent_id',''):
+                dispatch_children.setdefault(p.bl_parent_id, []).append(p)
+
+    # lazy panels are only registered when needed. Without ui, all panels are lazy
+    headless = _is_headless()
+    pending, ensure_panels = None, None
+    if (panels and (lazy_panels or headless) and not dispatch):
+        pending = list(panels)
+        def ensure_panels():
+            while pending:
+                _reg_userpanel(pending.pop(0), uniqueid)
+            return None
+
+    record = {
         'id':uniqueid,
         'name':name,
         'description':description,
         'icon':icon,
         'poll':poll,
+        'poll_cache':tuple(poll_cache) if poll_cache else None,
         'header':header,
         'draw':draw,
         'group':group,
-        },)
+        'panels_pending':pending,
+        'ensure_panels':ensure_panels,
+        'dispatch_panels':dispatch_panels,
+        'dispatch_children':dispatch_children,
+        'owner':OWNER,
+        'costs':{},
+        }
+
+    regpanels = tuple(panels) if (panels and not (lazy_panels or dispatch or headless)) else ()
+
+    return record, regpanels
+
+def remove_tabs(uniqueids:list):
+    """Remove many of your tabs at once, and unregister their panels. 
+    Only the tabs appended from your add-on can be removed."""
+
+    global IDAPPENDED_TO_REGISTRY, USER_PANELS
+
+    uniqueids = set(uniqueids)
+    for u in uniqueids.difference(IDAPPENDED_TO_REGISTRY):
+        print(f"WARNING: The tab '{u}' was not appended by this module instance. Impossible to remove it.\nFrom module instance: {__file__}")
+    uniqueids.intersection_update(IDAPPENDED_TO_REGISTRY)
+
+    if (not uniqueids):
+        return None
+
+    _discard_from_registry(uniqueids)
+    IDAPPENDED_TO_REGISTRY[:] = [u for u in IDAPPENDED_TO_REGISTRY if (u not in uniqueids)]
 
-    IDAPPENDED_TO_REGISTRY.append(uniqueid)
+    for panel in [p for p in reversed(USER_PANELS) if (p.CustTabUniqueID in uniqueids)]:
+        bpy.utils.unregister_class(panel)
+        USER_PANELS.remove(panel)
 
-    # register the panels ourselves
-    if (panels):
-        for panel in panels:
-            _reg_userpanel(panel, uniqueid)
+    _request_invalidate()
 
     return None
 
@@ -988,17 +2828,50 @@ def register():
 
     else:
         bpy.types.WindowManager.TabCustv1_usercount = bpy.props.IntProperty(name="How many users are using TabCustv1?", default=1,)
-        _reg_timers(True)
-        _reg_handlers(True)
-        _reg_nav_impostors(True)
-        _reg_tool_impostors(True)
+
+    #negotiate which module instance serves all calls, newest version wins
+    if (_THIS not in _engines()):
+        _engines().append(_THIS)
+    _elect_engine()
+
+    #no ui in background sessions (render farms..), only our registry is needed there
+    if (_is_headless()):
+        return None
+
+    _reg_runtime()
+
+    return None
+
+def _is_headless():
+    """is blender running without ui? (`blender --background`)"""
+    return bpy.app.background
+
+@_delegated
+def _reg_runtime():
+    """start our ui machinery, for all module instances, served by our engine. 
+    Deferred until a module instance registers within a session that has an ui. 
+    The hooks another module instance installed are replaced, older instances don't delegate their calls to us"""
+
+    if (getattr(bpy.types.WindowManager,'TabCustv1_runtime',None) is _THIS):
+        return None
+    bpy.types.WindowManager.TabCustv1_runtime = _THIS
+
+    _reg_timers(True)
+    _reg_handlers(True)
+    _reg_nav_impostors(True)
+    _reg_tool_impostors(True)
+    _serve_legacy_instances()
+
+    #tabs might have been appended while we had no ui
+    if any(type(d) is dict and d.get('dispatch_panels') for d in _get_registry()):
+        _reg_dispatcher()
 
     return None
 
 def unregister():
     """the main customtab module unregister, execute me on plugin deload, before unregistering your panels."""
 
-    global IDAPPENDED_TO_REGISTRY, USER_PANELS
+    global IDAPPENDED_TO_REGISTRY, USER_PANELS, PROVIDER_POOL
     wm = bpy.context.window_manager
 
     # 'TabCustv1_usercount' should always be there if there are other plugins as
@@ -1008,10 +2881,24 @@ def unregister():
 
     wm.TabCustv1_usercount -= 1
 
+    #if we were the engine, another module instance takes over, with its own hooks
+    if (_THIS in _engines()):
+        _engines().remove(_THIS)
+    _elect_engine()
+    if (_engines()) and (not _is_headless()):
+        _reg_runtime()
+
+    #stop our data providers
+    for name in list(PROVIDERS):
+        remove_provider(name)
+    if (PROVIDER_POOL is not None):
+        PROVIDER_POOL.shutdown(wait=False, cancel_futures=True)
+        PROVIDER_POOL = None
+
     #remove our enum items from the public centralized registry
-    for d in IDAPPENDED_TO_REGISTRY:
-        _remove_from_registry(d)
+    _discard_from_registry(IDAPPENDED_TO_REGISTRY)
     IDAPPENDED_TO_REGISTRY.clear()
+    _request_invalidate()
 
     #unregister our user panels
     for panel in USER_PANELS: